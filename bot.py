@@ -12,6 +12,7 @@ import time
 from helper import BotHelper, PersistentVoteView
 from datetime import datetime, timezone, timedelta, time as dt_time
 from functools import wraps
+from itertools import chain
 from typing import Any, Callable, Optional
 import discord
 import keyboard
@@ -30,7 +31,7 @@ except ImportError:
     sys.exit(1)
 from omegle import OmegleHandler
 from helper import BotHelper
-from tools import BotConfig, BotState, build_embed, build_role_update_embed, handle_errors, record_command_usage, record_command_usage_by_user
+from tools import BotConfig, BotState, build_embed, build_role_update_embed, handle_errors, new_analytics, record_command_usage, record_command_usage_by_user, record_command_usage_full
 load_dotenv()
 try:
     spotify_client_id = os.getenv('SPOTIPY_CLIENT_ID')
@@ -247,8 +248,8 @@ async def smart_timeout_monitor():
         next_wake_time = None
         expired_users = []
 
-        # 1. Check State for Expirations and Next Wake Time
-        async with state.moderation_lock:
+        # 1. Check State for Expirations and Next Wake Time (read-only pass)
+        async with state.moderation_lock.reader_lock:
             if not state.active_timeouts:
                 next_wake_time = None # Sleep indefinitely
             else:
@@ -279,10 +280,12 @@ async def smart_timeout_monitor():
                             name = member_obj.name if member_obj else "Unknown"
                             display_name = member_obj.display_name if member_obj else "Unknown"
                             
+                            now = datetime.now(timezone.utc)
                             state.recent_untimeouts.append((
-                                user_id, name, display_name, datetime.now(timezone.utc), 
-                                "Expired Naturally", "System", None
+                                user_id, name, display_name, now, 
+                                "Expired Naturally", "System", None, int(now.timestamp())
                             ))
+                            state.moderation_version += 1
 
                     # Send Notification to Chat
                     member = guild.get_member(user_id)
@@ -1008,7 +1011,7 @@ def require_user_preconditions():
     async def predicate(ctx):
         if ctx.author.id in bot_config.ALLOWED_USERS:
             return True
-        async with state.moderation_lock:
+        async with state.moderation_lock.reader_lock:
             if ctx.author.id in state.omegle_disabled_users:
                 await ctx.send('You are currently disabled from using any commands.', delete_after=10)
                 return False
@@ -1029,7 +1032,7 @@ def require_admin_preconditions():
             return False
         if is_allowed:
             return True
-        async with state.moderation_lock:
+        async with state.moderation_lock.reader_lock:
             if ctx.author.id in state.omegle_disabled_users:
                 await ctx.send('You are currently disabled from using any commands.', delete_after=10)
                 return False
@@ -1049,7 +1052,7 @@ def require_allowed_user():
         return False
     return commands.check(predicate)
 async def _handle_stream_vc_join(member: discord.Member):
-    async with state.moderation_lock:
+    async with state.moderation_lock.reader_lock:
         # This check ensures we only run this logic for users who haven't been processed before
         # (This relies on you clearing the JSON file as you mentioned)
         if member.id in state.users_received_rules:
@@ -1221,7 +1224,7 @@ async def init_vc_moderation():
     async with state.vc_lock:
         for member in streaming_vc.members:
             if not member.bot and member.id not in state.active_vc_sessions:
-                state.active_vc_sessions[member.id] = time.time()
+                state.active_vc_sessions[member.id] = int(time.time())
                 logger.info(f'Started tracking VC time for existing member: {member.name} (ID: {member.id})')
             if not member.bot and member.id not in bot_config.ALLOWED_USERS and (not (member.voice and member.voice.self_video)):
                 try:
@@ -1246,7 +1249,7 @@ def require_music_preconditions():
             return True
 
         # 2. Check global disable list
-        async with state.moderation_lock:
+        async with state.moderation_lock.reader_lock:
             if ctx.author.id in state.omegle_disabled_users:
                 await ctx.send('You are currently disabled from using any commands.', delete_after=10)
                 return False
@@ -1294,6 +1297,11 @@ async def on_ready() -> None:
         await load_state_async()
         logger.info('State loaded successfully')
 
+        # Pick up timeouts applied while the bot was offline
+        guild = bot.get_guild(bot_config.GUILD_ID)
+        if guild:
+            await helper.reconcile_active_timeouts(guild)
+
         # --- FIX & REFRESH LOGIC ---
         # 1. Register the view class so Discord knows it exists
         # Note: We use PersistentVoteView directly (imported above), passing 'helper' (the instance) to it
@@ -1453,6 +1461,23 @@ async def on_member_unban(guild: discord.Guild, user: discord.User) -> None:
 @handle_errors
 async def on_member_remove(member: discord.Member) -> None:
     await helper.handle_member_remove(member)
+@bot.event
+@handle_errors
+async def on_guild_channel_delete(channel: discord.abc.GuildChannel) -> None:
+    helper.handle_channel_delete(channel)
+@bot.event
+@handle_errors
+async def on_audit_log_entry_create(entry: discord.AuditLogEntry) -> None:
+    helper.handle_audit_log_entry(entry)
+@bot.event
+@handle_errors
+async def on_user_update(before: discord.User, after: discord.User) -> None:
+    # Username/global name changes arrive here rather than in on_member_update
+    if before.name != after.name or before.display_name != after.display_name:
+        guild = bot.get_guild(bot_config.GUILD_ID)
+        member = guild.get_member(after.id) if guild else None
+        if member:
+            helper.handle_member_rename(before, member)
 async def _delayed_music_disconnect():
     """
     Waits 30 seconds. If cancelled, nothing happens.
@@ -1652,17 +1677,19 @@ async def on_voice_state_update(member: discord.Member, before: discord.VoiceSta
             # --------------------------------------------------------
 
             if member.id not in state.active_vc_sessions:
-                state.active_vc_sessions[member.id] = time.time()
-                if member.id not in state.vc_time_data:
-                    state.vc_time_data[member.id] = {'total_time': 0, 'sessions': [], 'username': member.name, 'display_name': member.display_name}
+                state.active_vc_sessions[member.id] = int(time.time())
+                state.ensure_vc_record(member.id, member.name, member.display_name)
                 logger.info(f"VC Time Tracking: '{member.display_name}' started session.")
         elif was_in_streaming_vc and (not is_now_in_streaming_vc):
             if member.id in state.active_vc_sessions:
                 start_time = state.active_vc_sessions.pop(member.id)
-                duration = time.time() - start_time
-                if member.id in state.vc_time_data:
-                    state.vc_time_data[member.id]['total_time'] += duration
-                    state.vc_time_data[member.id]['sessions'].append({'start': start_time, 'end': time.time(), 'duration': duration, 'vc_name': before.channel.name})
+                end_time = int(time.time())
+                duration = end_time - start_time
+                if member.id in state.vc_total_time:
+                    state.vc_total_time[member.id] += duration
+                    state.vc_sessions[member.id].append({'start': start_time, 'end': end_time, 'duration': duration, 'vc_name': before.channel.name})
+                    if state.first_session_start is None or start_time < state.first_session_start:
+                        state.first_session_start = start_time
                     logger.info(f"VC Time Tracking: '{member.display_name}' ended session, adding {duration:.1f}s.")
                     
     # --- Moderation Logic ---
@@ -1778,7 +1805,7 @@ async def on_voice_state_update(member: discord.Member, before: discord.VoiceSta
             # Pause the Stream (!refresh) if the bot was "live" (relay sent)
             is_bot_live = False
             if state:
-                async with state.moderation_lock:
+                async with state.moderation_lock.reader_lock:
                     is_bot_live = state.relay_command_sent
             
             if is_bot_live:
@@ -1814,13 +1841,16 @@ async def on_voice_state_update(member: discord.Member, before: discord.VoiceSta
 @bot.event
 @handle_errors
 async def on_member_update(before: discord.Member, after: discord.Member) -> None:
+    if before.display_name != after.display_name:
+        helper.handle_member_rename(before, after)
     # --- 1. Handle Role Changes ---
     if before.roles != after.roles:
         roles_gained = [role for role in after.roles if role not in before.roles and role.name != '@everyone']
         roles_lost = [role for role in before.roles if role not in after.roles and role.name != '@everyone']
         if roles_gained or roles_lost:
             async with state.moderation_lock:
-                state.recent_role_changes.append((after.id, after.name, [r.name for r in roles_gained], [r.name for r in roles_lost], datetime.now(timezone.utc)))
+                now = datetime.now(timezone.utc)
+                state.recent_role_changes.append((after.id, after.name, [r.name for r in roles_gained], [r.name for r in roles_lost], now, int(now.timestamp())))
             channel = after.guild.get_channel(bot_config.CHAT_CHANNEL_ID)
             if channel:
                 embed = await build_role_update_embed(after, roles_gained, roles_lost)
@@ -1840,6 +1870,13 @@ async def on_member_update(before: discord.Member, after: discord.Member) -> Non
                     await helper._log_timeout_in_state(after, int(duration), reason, moderator.name, moderator.id)
                     asyncio.create_task(helper.update_timeouts_report_menu()) # Assumes helper.update_timeouts_report_menu() exists
                     break
+            else:
+                if after.id not in state.active_timeouts:
+                    # No audit entry found (and not logged by AutoMod); still
+                    # track the timeout so it stays in the index
+                    duration = (after.timed_out_until - datetime.now(timezone.utc)).total_seconds()
+                    await helper._log_timeout_in_state(after, int(duration), 'No reason provided', 'Unknown')
+                    asyncio.create_task(helper.update_timeouts_report_menu())
         else:
             # --- TIMEOUT REMOVED ---
             # This 'else' block runs when a timeout is REMOVED
@@ -1887,10 +1924,10 @@ async def on_member_update(before: discord.Member, after: discord.Member) -> Non
                 async with state.moderation_lock:
                     start_timestamp = state.active_timeouts.get(after.id, {}).get('start_timestamp', time.time())
                     duration = int(time.time() - start_timestamp)
-                    state.recent_untimeouts.append((after.id, after.name, after.display_name, datetime.now(timezone.utc), reason, moderator_name, moderator_id))
-                    if len(state.recent_untimeouts) > 100:
-                        state.recent_untimeouts.pop(0)
+                    now = datetime.now(timezone.utc)
+                    state.recent_untimeouts.append((after.id, after.name, after.display_name, now, reason, moderator_name, moderator_id, int(now.timestamp())))
                     state.active_timeouts.pop(after.id, None)
+                    state.moderation_version += 1
                 
                 # Try to send the notification, but don't stop if it fails
                 try:
@@ -1905,6 +1942,20 @@ async def on_member_update(before: discord.Member, after: discord.Member) -> Non
                 # Always remove the lock at the end
                 async with state.moderation_lock:
                     state.pending_timeout_removals.pop(after.id, None)
+    elif after.is_timed_out() and before.timed_out_until != after.timed_out_until:
+        # --- TIMEOUT CHANGED ---
+        # A moderator extended or shortened an active timeout; move the stored
+        # expiry so the monitor doesn't end it at the old time
+        async with state.moderation_lock:
+            data = state.active_timeouts.get(after.id)
+            if data is not None:
+                data['timeout_end'] = after.timed_out_until.timestamp()
+                state.moderation_version += 1
+                state.timeout_wake_event.set()
+        if data is None:
+            duration = (after.timed_out_until - datetime.now(timezone.utc)).total_seconds()
+            await helper._log_timeout_in_state(after, int(duration), 'No reason provided', 'Unknown')
+        asyncio.create_task(helper.update_timeouts_report_menu())
 
 @bot.event
 @handle_errors
@@ -2080,15 +2131,15 @@ async def daily_auto_stats_clear() -> None:
                 if (alt_vc := channel.guild.get_channel(vc_id)):
                     current_members.extend([m for m in alt_vc.members if not m.bot])
             async with state.vc_lock, state.analytics_lock, state.moderation_lock:
-                state.vc_time_data = {}
+                state.reset_vc_data()
                 state.active_vc_sessions = {}
-                state.analytics = {'command_usage': {}, 'command_usage_by_user': {}, 'violation_events': 0}
+                state.analytics = new_analytics()
                 state.user_violations = {}
                 if current_members:
-                    current_time = time.time()
+                    current_time = int(time.time())
                     for member in current_members:
                         state.active_vc_sessions[member.id] = current_time
-                        state.vc_time_data[member.id] = {'total_time': 0, 'sessions': [], 'username': member.name, 'display_name': member.display_name}
+                        state.ensure_vc_record(member.id, member.name, member.display_name)
                     logger.info(f'Restarted VC tracking for {len(current_members)} members after auto-clear')
             await channel.send('✅ Statistics automatically cleared and tracking restarted!')
         except Exception as e:
@@ -2184,8 +2235,7 @@ async def skip(ctx):
         return
     command_name = f'!{ctx.invoked_with}'
     if not getattr(ctx, 'from_button', False):
-        record_command_usage(state.analytics, command_name)
-        record_command_usage_by_user(state.analytics, ctx.author.id, command_name)
+        record_command_usage_full(state.analytics, ctx.author.id, command_name)
         await announce_command_usage(ctx, command_name)
         await omegle_handler.custom_skip(ctx)
 @bot.command(name='refresh', aliases=['pause'])
@@ -2198,8 +2248,7 @@ async def refresh(ctx):
         return
     command_name = f'!{ctx.invoked_with}'
     if not getattr(ctx, 'from_button', False):
-        record_command_usage(state.analytics, command_name)
-        record_command_usage_by_user(state.analytics, ctx.author.id, command_name)
+        record_command_usage_full(state.analytics, ctx.author.id, command_name)
         await announce_command_usage(ctx, command_name)
         await omegle_handler.refresh(ctx)
 @bot.command(name='report')
@@ -2212,8 +2261,7 @@ async def report(ctx):
         return
     command_name = f'!{ctx.invoked_with}'
     if not getattr(ctx, 'from_button', False):
-        record_command_usage(state.analytics, command_name)
-        record_command_usage_by_user(state.analytics, ctx.author.id, command_name)
+        record_command_usage_full(state.analytics, ctx.author.id, command_name)
         await announce_command_usage(ctx, command_name)
         await omegle_handler.report_user(ctx)
 @bot.command(name='purge')
@@ -2522,7 +2570,7 @@ async def msearch(ctx, *, query: str):
         
         added_count, skipped_count, was_idle = (0, 0, False)
         async with state.music_lock:
-            existing_paths = {s.get('path') for s in state.active_playlist + state.search_queue}
+            existing_paths = {s.get('path') for s in chain(state.active_playlist, state.search_queue)}
             if state.current_song:
                 existing_paths.add(state.current_song.get('path'))
             new_songs_to_queue = []
@@ -2634,7 +2682,7 @@ async def msearch(ctx, *, query: str):
     if is_generic_url and len(all_hits) > 1:
         added_count, skipped_count, was_idle = (0, 0, False)
         async with state.music_lock:
-            existing_paths = {s.get('path') for s in state.active_playlist + state.search_queue}
+            existing_paths = {s.get('path') for s in chain(state.active_playlist, state.search_queue)}
             if state.current_song:
                 existing_paths.add(state.current_song.get('path'))
             new_songs_to_queue = []
@@ -2886,7 +2934,7 @@ async def msearch(ctx, *, query: str):
                 songs_to_add = []
                 already_in_queue_count = 0
                 async with state.music_lock:
-                    existing_paths = {s.get('path') for s in state.active_playlist + state.search_queue}
+                    existing_paths = {s.get('path') for s in chain(state.active_playlist, state.search_queue)}
                     if state.current_song:
                         existing_paths.add(state.current_song.get('path'))
                 for song in songs_to_add_raw:
@@ -2993,8 +3041,7 @@ async def nowplaying(ctx):
     if not state.music_enabled:
         await ctx.send('Music features are currently disabled. Use `!mon` to enable.', delete_after=10)
         return
-    record_command_usage(state.analytics, '!nowplaying')
-    record_command_usage_by_user(state.analytics, ctx.author.id, '!nowplaying')
+    record_command_usage_full(state.analytics, ctx.author.id, '!nowplaying')
     await helper.show_now_playing(ctx)
 @bot.command(name='queue', aliases=['q'])
 @require_music_preconditions()
@@ -3004,8 +3051,7 @@ async def queue(ctx):
         await ctx.send('Music features are currently disabled. Use `!mon` to enable.', delete_after=10)
         return
     command_name = f'!{ctx.invoked_with}'
-    record_command_usage(state.analytics, command_name)
-    record_command_usage_by_user(state.analytics, ctx.author.id, command_name)
+    record_command_usage_full(state.analytics, ctx.author.id, command_name)
     await helper.show_queue(ctx)
 @bot.group(name='playlist', invoke_without_command=True)
 @require_music_preconditions()
@@ -3014,8 +3060,7 @@ async def playlist(ctx):
     if not state.music_enabled:
         await ctx.send('Music features are currently disabled. Use `!mon` to enable.', delete_after=10)
         return
-    record_command_usage(state.analytics, '!playlist')
-    record_command_usage_by_user(state.analytics, ctx.author.id, '!playlist')
+    record_command_usage_full(state.analytics, ctx.author.id, '!playlist')
     await ctx.send('Invalid playlist command. Use `!playlist save|load|list|delete <name>`.', delete_after=10)
 @playlist.command(name='save')
 @handle_errors
@@ -3025,7 +3070,7 @@ async def playlist_save(ctx, *, name: str):
         if not queue_to_save:
             await ctx.send('The queue is empty, there is nothing to save.', delete_after=10)
             return
-        state.playlists[name.lower()] = list(queue_to_save)
+        state.playlists[name.lower()] = queue_to_save  # Concatenation is already a new list
     await ctx.send(f'✅ Playlist **{name}** saved with {len(queue_to_save)} songs.')
     await save_state_async()
 @playlist.command(name='load')
@@ -3040,7 +3085,7 @@ async def playlist_load(ctx, *, name: Optional[str]=None):
             await ctx.send(f'❌ Playlist **{name}** could not be found.', delete_after=10)
             return
         songs_to_load = state.playlists[playlist_name]
-        existing_paths = {s.get('path') for s in state.active_playlist + state.search_queue}
+        existing_paths = {s.get('path') for s in chain(state.active_playlist, state.search_queue)}
         if state.current_song:
             existing_paths.add(state.current_song.get('path'))
         new_songs_to_queue = []
@@ -3296,6 +3341,7 @@ async def disable(ctx, user: discord.User):
             await ctx.send(f'User {user.mention} is already disabled.')
             return
         state.omegle_disabled_users.add(user.id)
+        state.moderation_version += 1
     await ctx.send(f'✅ User {user.mention} has been **disabled** from using any commands.')
     logger.info(f'User {user.name} disabled from all commands by {ctx.author.name}.')
     asyncio.create_task(helper.update_timeouts_report_menu()) # Assumes helper.update_timeouts_report_menu() exists
@@ -3312,6 +3358,7 @@ async def enable(ctx, user: discord.User):
             await ctx.send(f'User {user.mention} is not disabled.')
             return
         state.omegle_disabled_users.remove(user.id)
+        state.moderation_version += 1
     await ctx.send(f'✅ User {user.mention} has been **re-enabled** and can use commands again.')
     logger.info(f'User {user.name} re-enabled for all commands by {ctx.author.name}.')
     asyncio.create_task(helper.update_timeouts_report_menu()) # Assumes helper.update_timeouts_report_menu() exists
@@ -3582,15 +3629,13 @@ async def join(ctx) -> None:
 @require_allowed_user()
 @handle_errors
 async def clear_stats(ctx) -> None:
-    record_command_usage(state.analytics, '!clearstats')
-    record_command_usage_by_user(state.analytics, ctx.author.id, '!clearstats')
+    record_command_usage_full(state.analytics, ctx.author.id, '!clearstats')
     await helper.clear_stats(ctx)
 @bot.command(name='clearwhois')
 @require_allowed_user()
 @handle_errors
 async def clear_whois(ctx) -> None:
-    record_command_usage(state.analytics, '!clearwhois')
-    record_command_usage_by_user(state.analytics, ctx.author.id, '!clearwhois')
+    record_command_usage_full(state.analytics, ctx.author.id, '!clearwhois')
     await helper.clear_whois_data(ctx)
 @bot.command(name='display')
 @require_admin_preconditions()
@@ -3678,8 +3723,7 @@ async def move(ctx, member: discord.Member):
     if not is_allowed_user:
         async with state.cooldown_lock:
             state.move_command_cooldowns[author.id] = time.time()
-    record_command_usage(state.analytics, '!move')
-    record_command_usage_by_user(state.analytics, author.id, '!move')
+    record_command_usage_full(state.analytics, author.id, '!move')
     await helper.send_punishment_vc_notification(member=member, reason='They are sleeping', moderator_name=author.mention)
     try:
         await ctx.message.add_reaction('✅')
@@ -46,6 +46,9 @@ STATS_EXCLUDED_USERS = {}
 # --- ⚙️ GENERAL BOT SETTINGS ⚙️ ---
 # If True, the bot will delete any message in the MEDIA_ONLY_CHANNEL_ID that isn't a picture, video, or link.
 MOD_MEDIA = False
+# If True, join/leave/moderation announcements in the chat channel are posted through a "SkipCord-Events" webhook, which has its own rate limit.
+# Requires the Manage Webhooks permission (falls back to normal messages without it). Posts show the bot's name with a webhook tag.
+EVENTS_WEBHOOK = False
 
 # --- 🌐 BROWSER AUTOMATION (SELENIUM) 🌐 ---
 # The URL the bot will open. Change only if you use a different Omegle mirror.
@@ -133,6 +136,9 @@ TIMEOUT_DURATION_SECOND_VIOLATION = 60      # 1 minute
 # The timeout duration (in seconds) for a user's THIRD (and any subsequent) violation.
 TIMEOUT_DURATION_THIRD_VIOLATION = 300      # 5 minutes
 
+# The most recent entries shown per category in the !whois report (older ones are skipped).
+REPORT_MAX_ENTRIES_PER_CATEGORY = 50
+
 # --- 📝 CUSTOM MESSAGES 📝 ---
 # The message DMed to users with an ADMIN_ROLE_NAME when the `!join` command is used.
 JOIN_INVITE_MESSAGE = (
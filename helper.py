@@ -2,12 +2,17 @@
 
 import asyncio
 import discord
+import heapq
 import math
 import os
 import time
 import re
+from collections import OrderedDict
 from datetime import datetime, timezone, timedelta
-from typing import Any, Callable, Optional, Union, List, Tuple
+from functools import lru_cache
+from itertools import chain, islice
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, Optional, Set, Union, List, Tuple
 
 from discord.ext import commands
 from discord.ui import View, Button
@@ -16,11 +21,16 @@ from discord.ui import Select
 from loguru import logger
 
 from tools import (
+    BUTTON_COOLDOWNS_MAX_ENTRIES,
+    HISTORY_TIME_INDEX,
+    AsyncRateLimiter,
+    SlidingWindowLimiter,
     BotState,
     BotConfig,
+    build_embed,
     get_discord_age,
-    record_command_usage,
-    record_command_usage_by_user,
+    new_analytics,
+    record_command_usage_full,
     handle_errors,
     format_duration,
 )
@@ -29,17 +39,89 @@ from omegle import OmegleHandler
 
 # --- Utility Functions ---
 
-def format_departure_time(duration: timedelta) -> str:
+# Formats the duration a user was in the server for leave/kick/ban messages.
+format_departure_time = format_duration
+
+
+def _role_mentions(member: discord.Member) -> List[str]:
+    """
+    Returns mentions for a member's roles, excluding @everyone.
+    The @everyone role always shares the guild's ID, so we compare IDs
+    instead of names.
+    """
+    default_id = member.guild.id
+    return [role.mention for role in member.roles if role.id != default_id]
+
+
+@lru_cache(maxsize=1024)
+def _joined_role_mentions(role_ids: Tuple[int, ...]) -> str:
+    """Builds the space-separated `<@&id>` string for a tuple of role IDs."""
+    return " ".join(f"<@&{role_id}>" for role_id in role_ids)
+
+
+def _role_mention_string(member: discord.Member) -> str:
     """
-    Formats the duration a user was in the server for leave/kick/ban messages.
+    Returns a member's role mentions highest role first, excluding @everyone,
+    as one string ("" if they have none). Members share role sets often
+    enough that the joined string is cached by role IDs.
     """
-    return format_duration(duration)
+    default_id = member.guild.id
+    role_ids = tuple(role.id for role in reversed(member.roles) if role.id != default_id)
+    return _joined_role_mentions(role_ids) if role_ids else ""
+
+
+def _entries_since(
+    entries: Deque[tuple], time_idx: int, cutoff: datetime, limit: Optional[int] = None
+) -> List[tuple]:
+    """
+    Returns the tail of a history deque whose timestamps are >= cutoff,
+    keeping at most the last `limit` entries if given.
+    History is append-only in time order, so walking back from the newest
+    entry stops at the cutoff (or the limit) without touching older ones.
+    Deque indexing is O(n) away from the ends, so this beats a bisect.
+    """
+    tail = []
+    for entry in islice(reversed(entries), limit):
+        if entry[time_idx] < cutoff:
+            break
+        tail.append(entry)
+    tail.reverse()
+    return tail
+
+
+# --- !whois Line Templates ---
+# One template per category, filled with str.format in a comprehension
+# rather than assembled piece by piece per entry.
+_WHOIS_UNTIMEOUT_TMPL = "• <@{uid}> - by {mod} <t:{ts}:R>"
+_WHOIS_KICK_TMPL = "• {user} - by {mod}{reason} <t:{ts}:R>"
+_WHOIS_BAN_TMPL = "• {user}{reason} <t:{ts}:R>"
+_WHOIS_UNBAN_TMPL = "• {user} - by {mod} <t:{ts}:R>"
+_WHOIS_EVENT_TMPL = "• {user} <t:{ts}:R>"
+
+
+def _reason_suffix(reason: Optional[str], prefix: str) -> str:
+    """Returns ' <prefix> *reason*', or '' when no real reason was given."""
+    if reason and reason != "No reason provided":
+        return f" {prefix} *{reason}*"
+    return ""
+
+
+def _iter_entry_lines(
+    entries: Iterable[Any], process_entry: Callable[[Any], Union[str, Iterable[str]]]
+) -> Iterator[str]:
+    """Flattens process_entry results, passing plain strings through without wrapping."""
+    for entry in entries:
+        processed = process_entry(entry)
+        if isinstance(processed, str):
+            yield processed
+        elif processed:  # A list/generator of lines; None means nothing to show
+            yield from processed
 
 
 def create_message_chunks(
     entries: List[Any],
     title: str,
-    process_entry: Callable[[Any], str],
+    process_entry: Callable[[Any], Union[str, Iterable[str]]],
     max_chunk_size: int = 50,
     max_length: Optional[int] = None,  # Changed from 4000 to None for dynamic defaulting
     as_embed: bool = False,
@@ -52,7 +134,8 @@ def create_message_chunks(
     Args:
         entries: The list of items to process.
         title: The title for the message/embed.
-        process_entry: A function that converts an entry into a string.
+        process_entry: A function that converts an entry into a string, or an
+            iterable (e.g. a generator) of lines for entries that span several.
         max_chunk_size: The maximum number of entries per chunk.
         max_length: The maximum character length per chunk. Defaults to 2000 (text) or 4096 (embed).
         as_embed: If True, returns a list of embeds.
@@ -71,45 +154,47 @@ def create_message_chunks(
     chunks = []
     current_chunk = []
     current_length = 0
-    # Calculate title overhead if not using embeds (embed titles don't count towards description limit)
-    title_length = 0 if as_embed else len(f"**{title} ({len(entries)} total)**\n")
-
-    for entry in entries:
-        processed_list = process_entry(entry)
-        # Allow process_entry to return a list of lines for one entry
-        if not isinstance(processed_list, list):
-            processed_list = [processed_list]
-
-        for processed in processed_list:
-            if processed:
-                entry_length = len(processed) + 1  # +1 for the newline
+    # Text chunks repeat the same header, so build it once (embeds carry the title separately)
+    prefix = "" if as_embed else f"**{title} ({len(entries)} total)**\n"
+
+    lines: Iterable[str] = _iter_entry_lines(entries, process_entry)
+    if len(entries) <= max_chunk_size:
+        # Fast path: most lists fit in a single message, so join them in one go
+        lines = [line for line in lines if line]
+        body = "\n".join(lines)
+        if len(lines) <= max_chunk_size and len(body) + 1 <= max_length:
+            if not lines:
+                return []
+            if as_embed:
+                return [discord.Embed(title=title, description=body, color=embed_color)]
+            return [prefix + body]
+        # Too long after all; chunk the already-processed lines below
+
+    for processed in lines:
+        if processed:
+            entry_length = len(processed) + 1  # +1 for the newline
+            
+            # Check if adding this line exceeds limits (length or item count)
+            if (
+                current_length + entry_length > max_length and current_chunk
+            ) or len(current_chunk) >= max_chunk_size:
                 
-                # Check if adding this line exceeds limits (length or item count)
-                # We factor in title_length only for the first chunk of a non-embed message if needed,
-                # but generally, simpler logic is safer: just check current_length vs max.
-                if (
-                    current_length + entry_length > max_length and current_chunk
-                ) or len(current_chunk) >= max_chunk_size:
-                    
-                    # Finalize the current chunk
-                    if as_embed:
-                        embed = discord.Embed(
-                            title=title,
-                            description="\n".join(current_chunk),
-                            color=embed_color,
-                        )
-                        chunks.append(embed)
-                    else:
-                        chunks.append(
-                            f"**{title} ({len(entries)} total)**\n"
-                            + "\n".join(current_chunk)
-                        )
-                    # Start a new chunk
-                    current_chunk = []
-                    current_length = 0
+                # Finalize the current chunk
+                if as_embed:
+                    embed = discord.Embed(
+                        title=title,
+                        description="\n".join(current_chunk),
+                        color=embed_color,
+                    )
+                    chunks.append(embed)
+                else:
+                    chunks.append(prefix + "\n".join(current_chunk))
+                # Start a new chunk
+                current_chunk = []
+                current_length = 0
 
-                current_chunk.append(processed)
-                current_length += entry_length
+            current_chunk.append(processed)
+            current_length += entry_length
 
     # Add the last remaining chunk
     if current_chunk:
@@ -121,13 +206,131 @@ def create_message_chunks(
             )
             chunks.append(embed)
         else:
-            chunks.append(
-                f"**{title} ({len(entries)} total)**\n"
-                + "\n".join(current_chunk)
-            )
+            chunks.append(prefix + "\n".join(current_chunk))
 
     return chunks
 
+
+# --- Static Embeds ---
+# These never change at runtime, so build them once and send copies.
+
+_HELP_DESCRIPTION = (
+    "\n**Pause** --------- Pause Omegle\n"
+    "**Skip** ----------- Skip/Start Omegle\n"
+    "**Rules** ---------- Shows Server Rules\n"
+    "**Report** -------- Report Omegle User\n"
+    "**!commands** --- List All Commands\n"
+)
+
+_HELP_EMBED = discord.Embed(
+    title="👤  Omegle Controls  👤",
+    description=_HELP_DESCRIPTION,
+    color=discord.Color.blue(),
+)
+
+_USER_COMMANDS = (
+    "`!skip` - Skips the current Omegle user.\n"
+    "`!refresh` - Refreshes the Omegle page.\n"
+    "`!info` - Shows server info/rules.\n"
+    "`!rules` - Shows the server rules.\n"
+    "`!timer <1-60>` - Starts a timer (minutes).\n"
+    "`!timerstop` - Stops current user timer.\n"
+    "`!mskip` - Skips the current song.\n"
+    "`!mpp` - Toggles music play and pause.\n"
+    "`!vol 1-100` - Sets music volume (0-100).\n"
+    "`!m songname` - Searches for songs/URLs.\n"
+    "`!mclear` - Clears all songs from the search queue.\n"
+    "`!mshuffle` - Cycles music mode (Shuffle -> Alphabetical -> Loop).\n"
+    "`!np` - Shows currently playing song.\n"
+    "`!q` - Displays the interactive song queue.\n"
+    "`!playlist <save|load|list|delete> [name]` - Manages playlists."
+)
+
+_ADMIN_COMMANDS = (
+    "`!report` - Reports the current user on Omegle.\n"
+    "`!moff` - Disables all music features and disconnects the bot.\n"
+    "`!mon` - Enables all music features and connects the bot.\n"
+    "`!rtimeouts` - Removes all active timeouts from users.\n"
+    "`!display <user>` - Shows a detailed profile for a user.\n"
+    "`!role <@role>` - Lists all members in a specific role.\n"
+    "`!move <@user>` - Moves a user from Streaming to Punishment VC.\n"
+    "`!commands` - Shows this list of all commands."
+)
+
+_OWNER_COMMANDS = (
+    "`!purge <count>` - Purges a specified number of messages.\n"
+    "`!help` - Sends the interactive help menu with buttons.\n"
+    "`!music` - Sends the interactive music control menu.\n"
+    "`!times` - Shows top VC users by time.\n"
+    "`!timeouts` - Shows currently timed-out users.\n"
+    "`!bans` - Shows currently banned users.\n"
+    "`!hush` - Server-mutes all non-admin users in the Streaming VC.\n"
+    "`!rhush` / `!removehush` - Removes server-mutes from all users.\n"
+    "`!secret` - Server-mutes and deafens all non-admin users.\n"
+    "`!rsecret` / `!removesecret` - Removes mute/deafen from all users.\n"
+    "`!modoff` / `!modon` - Toggles automated VC moderation.\n"
+    "`!disablenotifications` / `!enablenotifications` - Toggles notifications.\n"
+    "`!ban <user>` - Bans user(s) with a reason prompt.\n"
+    "`!unban <user_id>` - Unbans a user by ID.\n"
+    "`!unbanall` - Unbans every user from the server.\n"
+    "`!disable <user>` - Disables a user from using commands.\n"
+    "`!enable <user>` - Re-enables a disabled user.\n"
+    "`!top` - Lists the top 10 oldest server/Discord accounts.\n"
+    "`!roles` - Lists all server roles and their members.\n"
+    "`!admin` / `!owner` - Lists configured bot owners and admins.\n"
+    "`!whois` - Shows a 24-hour report of server activity.\n"
+    "`!stats` - Shows a detailed analytics report.\n"
+    "`!join` - DMs a join invite to all users with an admin role.\n"
+    "`!clearstats` - Clears all statistical data.\n"
+    "`!clearwhois` - Clears all historical event data.\n"
+    "`!vote <roles or users>` - Starts a Smash or Pass vote.\n"
+    "`!endvote` - Stops the current Smash or Pass voting system.\n"
+    "`!shutdown` - Safely shuts down the bot."
+)
+
+
+@lru_cache(maxsize=None)
+def _command_list_embeds() -> Tuple[discord.Embed, ...]:
+    """Builds the three !commands embeds once."""
+    return (
+        build_embed("👤 User Commands (Camera On)", _USER_COMMANDS, discord.Color.blue()),
+        build_embed("🛡️ Admin Commands (Camera On)", _ADMIN_COMMANDS, discord.Color.red()),
+        build_embed("👑 Owner Commands (No Requirements)", _OWNER_COMMANDS, discord.Color.gold()),
+    )
+
+
+class ConfirmView(discord.ui.View):
+    """
+    Confirm/Cancel buttons for destructive commands. Only the invoking user
+    can answer; `result` is True/False once answered, None on timeout.
+    """
+    def __init__(
+        self, author_id: int, timeout: float = 30.0, confirm_label: str = "Confirm"
+    ):
+        super().__init__(timeout=timeout)
+        self.author_id = author_id
+        self.result: Optional[bool] = None
+        self.confirm.label = confirm_label
+
+    async def _resolve(self, interaction: discord.Interaction, result: bool):
+        if interaction.user.id != self.author_id:
+            await interaction.response.send_message(
+                "You cannot respond to this confirmation.", ephemeral=True
+            )
+            return
+        self.result = result
+        await interaction.response.edit_message(view=None)  # Remove buttons
+        self.stop()
+
+    @discord.ui.button(label="Confirm", style=discord.ButtonStyle.danger, emoji="✅")
+    async def confirm(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._resolve(interaction, True)
+
+    @discord.ui.button(label="Cancel", style=discord.ButtonStyle.secondary, emoji="❌")
+    async def cancel(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._resolve(interaction, False)
+
+
 class VotingBoothView(discord.ui.View):
     """
     Ephemeral view that lets a user cycle through targets.
@@ -263,8 +466,23 @@ class PersistentVoteView(discord.ui.View):
             ephemeral=True
         )
 
+async def _announce_button_use(interaction: discord.Interaction, command: str) -> None:
+    """Posts the short-lived "used `!cmd`" notice for a menu button press."""
+    try:
+        announcement_content = f"**{interaction.user.display_name}** used `{command}`"
+        await interaction.channel.send(announcement_content, delete_after=30.0)
+        logger.info(f"Announced button use: {interaction.user.name} used {command}")
+    except discord.Forbidden:
+        logger.warning(f"Missing permissions to send announcement message in #{interaction.channel.name}")
+    except Exception as e:
+        logger.error(f"Failed to send button usage announcement: {e}")
+
+
 async def _button_callback_handler(
-    interaction: discord.Interaction, command: str, helper: "BotHelper"
+    interaction: discord.Interaction,
+    command: str,
+    helper: "BotHelper",
+    command_obj: Optional[commands.Command] = None,
 ) -> None:
     """
     Central handler for all button presses from the static menus.
@@ -283,16 +501,17 @@ async def _button_callback_handler(
         state = helper.state
 
         # --- Check 1: Command Disabled ---
-        async with state.moderation_lock:
-            if user_id in state.omegle_disabled_users:
-                await interaction.followup.send(
-                    "You are currently disabled from using any commands.",
-                    ephemeral=True,
-                )
-                logger.warning(
-                    f"Blocked disabled user {interaction.user.name} from using button command {command}."
-                )
-                return
+        async with state.moderation_lock.reader_lock:
+            is_disabled = user_id in state.omegle_disabled_users
+        if is_disabled:
+            await interaction.followup.send(
+                "You are currently disabled from using any commands.",
+                ephemeral=True,
+            )
+            logger.warning(
+                f"Blocked disabled user {interaction.user.name} from using button command {command}."
+            )
+            return
 
         # --- Check 2: Correct Channel ---
         if (
@@ -310,7 +529,7 @@ async def _button_callback_handler(
             is_allowed = user_id in bot_config.ALLOWED_USERS
             is_admin_role = False
             if isinstance(user_member, discord.Member):
-                is_admin_role = any(role.name in bot_config.ADMIN_ROLE_NAME for role in user_member.roles)
+                is_admin_role = any(role.name in helper.admin_role_names for role in user_member.roles)
             
             if not (is_allowed or is_admin_role):
                 await interaction.followup.send("⛔ You do not have permission to use this button.", ephemeral=True)
@@ -370,36 +589,45 @@ async def _button_callback_handler(
                 state.last_omegle_command_time = current_time
 
         # --- Check 5: Per-User Button Cooldown ---
+        warn_time_left = None
         async with state.cooldown_lock:
-            if user_id in state.button_cooldowns:
-                last_used, warned = state.button_cooldowns[user_id]
+            cooldowns = state.button_cooldowns
+            entry = cooldowns.get(user_id)
+            if entry is not None:
+                last_used, warned = entry
                 time_left = bot_config.COMMAND_COOLDOWN - (current_time - last_used)
                 if time_left > 0:
                     if not warned:
-                        await interaction.followup.send(
-                            f"{interaction.user.mention}, wait {int(time_left)}s before using another button.",
-                            ephemeral=True,
-                        )
-                        state.button_cooldowns[user_id] = (last_used, True)
-                    return
-            state.button_cooldowns[user_id] = (current_time, False)
+                        cooldowns[user_id] = (last_used, True)
+                        warn_time_left = time_left
+                    else:
+                        return
+            if warn_time_left is None:
+                cooldowns[user_id] = (current_time, False)
+                cooldowns.move_to_end(user_id)
+                # Drop the least recently used entry, and any stale ones behind it
+                stale_before = current_time - bot_config.COMMAND_COOLDOWN * 10
+                while cooldowns:
+                    oldest_id, (oldest_time, _) = next(iter(cooldowns.items()))
+                    if len(cooldowns) <= BUTTON_COOLDOWNS_MAX_ENTRIES and oldest_time >= stale_before:
+                        break
+                    del cooldowns[oldest_id]
+        if warn_time_left is not None:
+            await interaction.followup.send(
+                f"{interaction.user.mention}, wait {int(warn_time_left)}s before using another button.",
+                ephemeral=True,
+            )
+            return
 
         # --- All Checks Passed ---
 
-        # Send a public announcement message (This goes to the channel, not the interaction response)
-        try:
-            announcement_content = f"**{interaction.user.display_name}** used `{command}`"
-            await interaction.channel.send(announcement_content, delete_after=30.0)
-            logger.info(f"Announced button use: {interaction.user.name} used {command}")
-        except discord.Forbidden:
-            logger.warning(f"Missing permissions to send announcement message in #{interaction.channel.name}")
-        except Exception as e:
-            logger.error(f"Failed to send button usage announcement: {e}")
+        # Send a public announcement message (This goes to the channel, not the interaction response).
+        # It runs alongside the command so the click isn't held up by an extra REST round trip.
+        helper._spawn(_announce_button_use(interaction, command))
 
         # Record statistics
         try:
-            record_command_usage(helper.state.analytics, command)
-            record_command_usage_by_user(helper.state.analytics, interaction.user.id, command)
+            record_command_usage_full(helper.state.analytics, interaction.user.id, command)
         except Exception as e:
             logger.error(f"Failed to record button command usage in stats: {e}", exc_info=True)
 
@@ -429,14 +657,9 @@ async def _button_callback_handler(
                 await helper.omegle_handler.report_user(mock_ctx)
             elif command == "!rules":
                 await helper.show_rules(mock_ctx)
-            elif command == "!mpauseplay":
-                cmd_obj = helper.bot.get_command("mpauseplay")
-                if cmd_obj: await cmd_obj.callback(mock_ctx)
-            elif command == "!mskip":
-                cmd_obj = helper.bot.get_command("mskip")
-                if cmd_obj: await cmd_obj.callback(mock_ctx)
-            elif command == "!mshuffle":
-                cmd_obj = helper.bot.get_command("mshuffle")
+            elif command in ("!mpauseplay", "!mskip", "!mshuffle"):
+                # Music buttons carry their Command, resolved when the view was built
+                cmd_obj = command_obj or helper.bot.get_command(command[1:])
                 if cmd_obj: await cmd_obj.callback(mock_ctx)
             elif command == "!mclear":
                 # !mclear needs the interaction object for its confirmation modal
@@ -494,24 +717,32 @@ class MusicButton(Button):
         super().__init__(label=label, emoji=emoji, style=style)
         self.command = command
         self.helper = helper
+        # Resolve the bot command once instead of on every click
+        self.command_obj = helper.bot.get_command(command.lstrip("!"))
+        if self.command_obj is None:
+            logger.warning(f"Music button {command} has no matching bot command.")
 
     async def callback(self, interaction: discord.Interaction):
         # Pass the interaction to the central handler
-        await _button_callback_handler(interaction, self.command, self.helper)
+        await _button_callback_handler(
+            interaction, self.command, self.helper, self.command_obj
+        )
 
 
 class HelpView(View):
     """The persistent View that holds the Omegle control buttons."""
 
+    # (emoji, label, command, style) for each button, in display order
+    BUTTON_SPEC = (
+        ("🔄", "👤", "!refresh", discord.ButtonStyle.danger),
+        ("⏭️", "👤", "!skip", discord.ButtonStyle.success),
+        ("ℹ️", "👤", "!rules", discord.ButtonStyle.primary),
+        ("🚩", "👤", "!report", discord.ButtonStyle.secondary),
+    )
+
     def __init__(self, helper: "BotHelper"):
         super().__init__(timeout=None)  # Persistent view
-        cmds = [
-            ("🔄", "👤", "!refresh", discord.ButtonStyle.danger),
-            ("⏭️", "👤", "!skip", discord.ButtonStyle.success),
-            ("ℹ️", "👤", "!rules", discord.ButtonStyle.primary),
-            ("🚩", "👤", "!report", discord.ButtonStyle.secondary),
-        ]
-        for e, l, c, s in cmds:
+        for e, l, c, s in self.BUTTON_SPEC:
             self.add_item(HelpButton(label=l, emoji=e, command=c, style=s, helper=helper))
 
 
@@ -548,40 +779,32 @@ class QueueDropdown(discord.ui.Select):
             return
 
         selected_index = int(self.values[0])
+        selected_song = None
+        # Only the queue mutation happens under music_lock; replies are sent after release
         async with self.state.music_lock:
-            full_queue = self.state.active_playlist + self.state.search_queue
-            if selected_index >= len(full_queue):
-                await interaction.response.send_message(
-                    "That song is no longer in the queue. The list may be outdated.",
-                    ephemeral=True,
-                    delete_after=10,
-                )
-                try:
-                    await interaction.message.delete()
-                except discord.NotFound:
-                    pass
-                return
+            len_active = len(self.state.active_playlist)
+            if selected_index < len_active + len(self.state.search_queue):
+                # Take the selected song out of whichever queue holds it
+                if selected_index < len_active:
+                    selected_song = self.state.active_playlist.pop(selected_index)
+                else:
+                    selected_song = self.state.search_queue.pop(selected_index - len_active)
+                # Insert at the front of the search_queue to be played next
+                self.state.search_queue.insert(0, selected_song)
+                # Set override flag to ensure it plays next even in shuffle
+                self.state.play_next_override = True
 
-            # Find the selected song and move it to the front of the search queue
-            selected_song = full_queue[selected_index]
+        if selected_song is None:
+            await interaction.response.send_message(
+                "That song is no longer in the queue. The list may be outdated.",
+                ephemeral=True,
+                delete_after=10,
+            )
             try:
-                self.state.active_playlist.remove(selected_song)
-            except ValueError:
-                try:
-                    self.state.search_queue.remove(selected_song)
-                except ValueError:
-                    logger.error(
-                        f"FATAL: QueueDropdown song {selected_song.get('title')} not found in any queue for removal."
-                    )
-                    await interaction.response.send_message(
-                        "A queue consistency error occurred.", ephemeral=True
-                    )
-                    return
-            
-            # Insert at the front of the search_queue to be played next
-            self.state.search_queue.insert(0, selected_song)
-            # Set override flag to ensure it plays next even in shuffle
-            self.state.play_next_override = True
+                await interaction.message.delete()
+            except discord.NotFound:
+                pass
+            return
 
         # Stop the current song to trigger the 'after' callback
         if self.bot.voice_client_music and self.bot.voice_client_music.is_connected():
@@ -618,7 +841,12 @@ class QueueView(discord.ui.View):
         self.author = author
         self.current_page = 0
         self.page_size = 25  # Max options in a dropdown
-        self.full_queue = []
+        # Live references to the two queues plus their lengths at the last
+        # refresh; pages are sliced out on demand instead of copying it all
+        self._active_ref: List[Dict[str, Any]] = []
+        self._search_ref: List[Dict[str, Any]] = []
+        self._len_active = 0
+        self._len_total = 0
         self.message = None  # To store the message object for editing
 
     async def start(self):
@@ -629,16 +857,16 @@ class QueueView(discord.ui.View):
     async def update_queue(self):
         """Fetches the latest queue from the bot state."""
         async with self.state.music_lock:
-            # Get a snapshot of the current queue
-            self.full_queue = list(
-                enumerate(self.state.active_playlist + self.state.search_queue)
-            )
-        self.total_pages = (len(self.full_queue) + self.page_size - 1) // self.page_size
+            self._active_ref = self.state.active_playlist
+            self._search_ref = self.state.search_queue
+            self._len_active = len(self._active_ref)
+            self._len_total = self._len_active + len(self._search_ref)
+        self.total_pages = (self._len_total + self.page_size - 1) // self.page_size
         self.total_pages = max(1, self.total_pages)  # At least 1 page
 
     def get_content(self) -> str:
         """Gets the text content for the queue message."""
-        total_songs = len(self.full_queue)
+        total_songs = self._len_total
         page_num = self.current_page + 1
         return f"**Current Queue ({total_songs} songs):** Page {page_num}/{self.total_pages}\n*(Select a song to jump to it)*"
 
@@ -648,8 +876,16 @@ class QueueView(discord.ui.View):
         
         # Get items for the current page
         start_index = self.current_page * self.page_size
-        end_index = start_index + self.page_size
-        page_items = self.full_queue[start_index:end_index]
+        end_index = min(start_index + self.page_size, self._len_total)
+        page_items = []
+        for i in range(start_index, end_index):
+            try:
+                if i < self._len_active:
+                    page_items.append((i, self._active_ref[i]))
+                else:
+                    page_items.append((i, self._search_ref[i - self._len_active]))
+            except IndexError:
+                break  # Queue shrank since the last refresh
 
         if page_items:
             self.add_item(
@@ -714,15 +950,17 @@ class QueueView(discord.ui.View):
 class MusicView(View):
     """The persistent View that holds the music control buttons."""
 
+    # (emoji, label, command, style) for each button, in display order
+    BUTTON_SPEC = (
+        ("⏯️", "🎵", "!mpauseplay", discord.ButtonStyle.danger),
+        ("⏭️", "🎵", "!mskip", discord.ButtonStyle.success),
+        ("🔀", "🎵", "!mshuffle", discord.ButtonStyle.primary),
+        ("❌", "🎵", "!mclear", discord.ButtonStyle.secondary),
+    )
+
     def __init__(self, helper: "BotHelper"):
         super().__init__(timeout=None)
-        btns = [
-            ("⏯️", "🎵", "!mpauseplay", discord.ButtonStyle.danger),
-            ("⏭️", "🎵", "!mskip", discord.ButtonStyle.success),
-            ("🔀", "🎵", "!mshuffle", discord.ButtonStyle.primary),
-            ("❌", "🎵", "!mclear", discord.ButtonStyle.secondary),
-        ]
-        for e, l, c, s in btns:
+        for e, l, c, s in self.BUTTON_SPEC:
             self.add_item(MusicButton(label=l, emoji=e, command=c, style=s, helper=helper))
 
 
@@ -755,6 +993,77 @@ class BotHelper:
         self.update_music_menu = update_menu_func
         self.trigger_full_menu_repost = trigger_repost_func # <-- ADDED
         self.LEAVE_BATCH_DELAY_SECONDS = 10  # Batch leave events
+        # Ban/unban/kick entries pushed by on_audit_log_entry_create, keyed by
+        # (action, target id), so member handlers needn't poll the audit log
+        self.AUDIT_CACHE_MAX_ENTRIES = 256
+        self._audit_cache: "OrderedDict[Tuple[discord.AuditLogAction, int], discord.AuditLogEntry]" = OrderedDict()
+        self._audit_waiters: Dict[Tuple[discord.AuditLogAction, int], asyncio.Event] = {}
+        self._audit_feed_active = False  # Set once the gateway delivers an entry
+        self.SAVE_DEBOUNCE_SECONDS = 0.5  # Coalesce back-to-back save requests
+        self._save_dirty = False
+        self._save_task: Optional[asyncio.Task] = None
+        self.TIMEOUTS_MENU_DEBOUNCE_SECONDS = 2.0  # Fold bursts into one edit
+        self._timeouts_dirty = False
+        self._timeouts_edit_task: Optional[asyncio.Task] = None
+        # Fetched once and reused for edits until the menu is reposted
+        self._timeouts_msg: Optional[discord.Message] = None
+        # The event loop only keeps weak references to tasks; hold fire-and-
+        # forget ones here until they finish so they can't be collected early
+        self._bg_tasks: Set[asyncio.Task] = set()
+        self.BAN_CACHE_TTL_SECONDS = 60  # Reuse !bans results
+        self.TIMEOUTS_EMBED_TTL_SECONDS = 15  # Reuse the moderation status embed
+        # username/display name -> {member id: member} in member-cache order,
+        # built on first use and then kept current by the join/remove/rename
+        # events. Several members can share a name; lookups return the first.
+        self._name_index: Optional[Dict[str, Dict[int, discord.Member]]] = None
+        # CHAT_CHANNEL_ID resolved on first use; cleared if the channel is deleted
+        self._chat_channel: Optional[discord.TextChannel] = None
+        # With EVENTS_WEBHOOK on, event embeds go through a channel webhook,
+        # which has its own rate-limit bucket; None means not looked up yet
+        self.EVENTS_WEBHOOK_NAME = "SkipCord-Events"
+        self._events_webhook: Optional[discord.Webhook] = None
+        self._events_webhook_disabled = False  # Set when we lack Manage Webhooks
+        # Serializes the lookup-or-create so a burst of events makes one webhook
+        self._events_webhook_lock = asyncio.Lock()
+        self.BANNER_CACHE_TTL_SECONDS = 3600  # Banners rarely change
+        self.BANNER_CACHE_MAX_ENTRIES = 1024
+        # user_id -> (banner URL or None, monotonic fetch time), oldest first
+        self._banner_cache: Dict[int, Tuple[Optional[str], float]] = {}
+        # (moderation_version, monotonic build time, embed) for the timeouts menu
+        self._timeouts_embed_cache: Optional[Tuple[int, float, discord.Embed]] = None
+        # Shared across report commands; Discord allows ~5 messages / 5s per channel
+        self.send_limiter = AsyncRateLimiter(5, 5)
+        self.dm_limiter = SlidingWindowLimiter(30, 60)  # Bulk DMs, per minute
+        # O(1) role-name lookups for admin checks
+        self.admin_role_names = frozenset(self.bot_config.ADMIN_ROLE_NAME)
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """Starts a fire-and-forget task, keeping a reference until it's done."""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
+
+    def request_save(self) -> None:
+        """
+        Schedules a state save without waiting on disk I/O. Requests made
+        while a save is pending (or running) are folded into one more write.
+        """
+        if not self.save_state:
+            return
+        self._save_dirty = True
+        if self._save_task is None or self._save_task.done():
+            self._save_task = asyncio.create_task(self._flush_saves())
+
+    async def _flush_saves(self) -> None:
+        """Background writer for request_save; loops until no save is pending."""
+        while self._save_dirty:
+            await asyncio.sleep(self.SAVE_DEBOUNCE_SECONDS)
+            self._save_dirty = False
+            try:
+                await self.save_state()
+            except Exception as e:
+                logger.error(f"Deferred state save failed: {e}", exc_info=True)
 
     async def _schedule_leave_processing(self):
         """Schedules the leave batch processor to run after a delay."""
@@ -776,7 +1085,7 @@ class BotHelper:
             self.state.leave_buffer.clear()
             self.state.leave_batch_task = None
 
-        chat_channel = self.bot.get_channel(self.bot_config.CHAT_CHANNEL_ID)
+        chat_channel = self._get_chat_channel()
         log_channel = self.bot.get_channel(self.bot_config.LOG_GC)
 
         if not chat_channel and not log_channel:
@@ -784,6 +1093,8 @@ class BotHelper:
             return
 
         count = len(members_to_announce)
+        # The batch is announced as one event, so one timestamp serves every member
+        now = datetime.now(timezone.utc)
         embed = None
         is_highlight_event = False
 
@@ -808,7 +1119,7 @@ class BotHelper:
             )
             embed.set_author(name=member_data["name"], icon_url=member_data["avatar_url"])
             if member_data["joined_at"]:
-                duration = datetime.now(timezone.utc) - member_data["joined_at"]
+                duration = now - member_data["joined_at"]
                 duration_str = format_departure_time(duration)
                 embed.add_field(name="Time in Server", value=duration_str, inline=True)
             embed.add_field(name="Roles", value=role_string, inline=True)
@@ -827,26 +1138,27 @@ class BotHelper:
             embed = discord.Embed(
                 title=title, color=embed_color
             )
-            description_lines = []
-            for member_data in members_to_announce[:10]:  # Show up to 10
-                duration_str = ""
-                if member_data["joined_at"]:
-                    duration = datetime.now(timezone.utc) - member_data["joined_at"]
-                    duration_str = f" (Stayed for {format_departure_time(duration)})"
-                
-                roles_list = member_data.get("roles_list", [])
+            def departure_line(member_data: Dict[str, Any]) -> str:
+                duration_str = (
+                    f" (Stayed for {format_departure_time(now - member_data['joined_at'])})"
+                    if member_data["joined_at"]
+                    else ""
+                )
+                roles_list = member_data.get("roles_list")
                 roles_str = f" [Roles: {len(roles_list)}]" if roles_list else ""
+                return f"• {member_data['name']}{duration_str}{roles_str}"
 
-                description_lines.append(f"• {member_data['name']}{duration_str}{roles_str}")
-            
-            description = "\n".join(description_lines)
+            # Show up to 10
+            description = "\n".join(
+                departure_line(member_data) for member_data in members_to_announce[:10]
+            )
             if count > 10:
                 description += f"\n...and {count - 10} others."
             
             embed.description = description
             embed.set_footer(text=f"{count} members left the server.")
 
-        async with self.state.moderation_lock:
+        async with self.state.moderation_lock.reader_lock:
             notifications_are_enabled = self.state.notifications_enabled
         
         if notifications_are_enabled and embed:
@@ -865,7 +1177,7 @@ class BotHelper:
 
             if should_send_to_chat:
                 try:
-                    await chat_channel.send(embed=embed)
+                    await self._send_event_embed(chat_channel, embed)
                 except discord.Forbidden:
                     logger.warning(f"Failed to send leave notification to CHAT_CHANNEL: Missing permissions.")
             
@@ -888,8 +1200,48 @@ class BotHelper:
                 "timed_by_id": moderator_id,
                 "start_timestamp": time.time(),
             }
+            self.state.moderation_version += 1
             self.state.timeout_wake_event.set()
 
+    async def reconcile_active_timeouts(self, guild: discord.Guild) -> None:
+        """
+        Adds members already timed out in the guild to active_timeouts, so the
+        index behind _timed_out_members also covers timeouts applied while the
+        bot was offline. Called once on startup.
+        """
+        now = time.time()
+        added = 0
+        async with self.state.moderation_lock:
+            for member in guild.members:
+                if member.id in self.state.active_timeouts or not member.is_timed_out():
+                    continue
+                self.state.active_timeouts[member.id] = {
+                    "timeout_end": member.timed_out_until.timestamp(),
+                    "reason": "No reason provided",
+                    "timed_by": "Unknown",
+                    "timed_by_id": None,
+                    "start_timestamp": now,
+                }
+                added += 1
+            if added:
+                self.state.moderation_version += 1
+                self.state.timeout_wake_event.set()
+        if added:
+            logger.info(f"Added {added} existing timeout(s) to active_timeouts.")
+
+    def _timed_out_members(self, guild: discord.Guild) -> List[discord.Member]:
+        """
+        Returns members currently timed out, using active_timeouts as the index
+        instead of scanning the whole member cache. The index is seeded from
+        the guild on startup by reconcile_active_timeouts.
+        """
+        return [
+            member
+            for user_id in self.state.active_timeouts
+            if (member := guild.get_member(user_id)) is not None
+            and member.is_timed_out()
+        ]
+
     async def _create_departure_embed(
         self,
         member_or_user: Union[discord.Member, discord.User],
@@ -897,62 +1249,311 @@ class BotHelper:
         reason: str,
         action: str,
         color: discord.Color,
+        now: Optional[datetime] = None,
     ) -> discord.Embed:
         """
         Creates a standardized embed for Kick or Ban announcements.
+        Batch callers can pass a shared `now` for the time-in-server field.
         """
-        mention = getattr(member_or_user, "mention", f"<@{member_or_user.id}>")
-        author_name = getattr(member_or_user, "name", "Unknown User")
-        avatar_url = (
-            member_or_user.display_avatar.url
-            if hasattr(member_or_user, "display_avatar")
-            and member_or_user.display_avatar
-            else None
-        )
-
-        if action.upper() == "KICKED":
-            description = f"{mention} **was {action.upper()}**"
+        # Real members/users (the normal case) are read directly; anything
+        # else is a stand-in object and falls back to defensive lookups.
+        is_member = isinstance(member_or_user, discord.Member)
+        if is_member or isinstance(member_or_user, discord.User):
+            mention = member_or_user.mention
+            author_name = member_or_user.name
+            avatar_url = member_or_user.display_avatar.url
+            joined_at = member_or_user.joined_at if is_member else None
+        else:
+            mention = getattr(member_or_user, "mention", f"<@{member_or_user.id}>")
+            author_name = getattr(member_or_user, "name", "Unknown User")
+            display_avatar = getattr(member_or_user, "display_avatar", None)
+            avatar_url = display_avatar.url if display_avatar else None
+            joined_at = getattr(member_or_user, "joined_at", None)
+
+        action_upper = action.upper()
+        if action_upper == "KICKED":
+            description = f"{mention} **was {action_upper}**"
         else:
-            description = f"{mention} **{action.upper()}**"
+            description = f"{mention} **{action_upper}**"
 
         embed = discord.Embed(description=description, color=color)
         if avatar_url:
             embed.set_author(name=author_name, icon_url=avatar_url)
             embed.set_thumbnail(url=avatar_url)
 
-        # Try to fetch user banner
-        try:
-            user_obj = await self.bot.fetch_user(member_or_user.id)
-            if user_obj.banner:
-                embed.set_image(url=user_obj.banner.url)
-        except Exception:
-            pass  # Ignore if banner can't be fetched
+        if (banner_url := await self._get_banner_url(member_or_user)):
+            embed.set_image(url=banner_url)
 
         moderator_mention = getattr(moderator, "mention", str(moderator))
         embed.add_field(name="Moderator", value=moderator_mention, inline=True)
 
-        if hasattr(member_or_user, "joined_at") and member_or_user.joined_at:
-            duration = datetime.now(timezone.utc) - member_or_user.joined_at
+        if joined_at:
+            duration = (now or datetime.now(timezone.utc)) - joined_at
             duration_str = format_departure_time(duration)
             embed.add_field(name="Time in Server", value=duration_str, inline=True)
 
-        if hasattr(member_or_user, "roles"):
-            if isinstance(member_or_user, discord.Member):
-                roles = [
-                    role.mention
-                    for role in member_or_user.roles
-                    if role.name != "@everyone"
-                ]
-            else:
-                roles = member_or_user.roles  # Handle role string from leave buffer
-            
-            if roles:
-                roles.reverse()
-                embed.add_field(name="Roles", value=" ".join(roles), inline=True)
+        if is_member:
+            roles_str = _role_mention_string(member_or_user)
+        elif hasattr(member_or_user, "roles"):
+            roles = member_or_user.roles  # Handle role string from leave buffer
+            roles.reverse()
+            roles_str = " ".join(roles)
+        else:
+            roles_str = ""
+        if roles_str:
+            embed.add_field(name="Roles", value=roles_str, inline=True)
         
         embed.add_field(name="Reason", value=reason, inline=False)
         return embed
 
+    async def _resolve_users(
+        self, guild: discord.Guild, user_ids: List[int]
+    ) -> Dict[int, Union[discord.User, discord.Member]]:
+        """
+        Resolves user IDs to User/Member objects with as few requests as possible:
+        the local cache first, then one batched gateway member query, and only
+        then individual fetch_user calls for people who are no longer in the server.
+        """
+        resolved: Dict[int, Union[discord.User, discord.Member]] = {}
+        missing = []
+        for user_id in user_ids:
+            user = self.bot.get_user(user_id) or guild.get_member(user_id)
+            if user:
+                resolved[user_id] = user
+            else:
+                missing.append(user_id)
+
+        if missing:
+            try:
+                for i in range(0, len(missing), 100):  # query_members caps at 100 IDs
+                    members = await guild.query_members(
+                        user_ids=missing[i : i + 100], limit=100, cache=True
+                    )
+                    for member in members:
+                        resolved[member.id] = member
+            except Exception as e:
+                logger.warning(f"Batched member query failed: {e}")
+
+            still_missing = [uid for uid in missing if uid not in resolved]
+            if still_missing:
+                # Cap in-flight requests; discord.py handles 429 back-off itself
+                fetch_sem = asyncio.Semaphore(5)
+
+                async def fetch_user(uid):
+                    async with fetch_sem:
+                        return await self.bot.fetch_user(uid)
+
+                fetched = await asyncio.gather(
+                    *(fetch_user(uid) for uid in still_missing),
+                    return_exceptions=True,
+                )
+                for user_id, user in zip(still_missing, fetched):
+                    if not isinstance(user, BaseException):
+                        resolved[user_id] = user
+        return resolved
+
+    def _find_member_by_name(
+        self, guild: discord.Guild, name: str
+    ) -> Optional[discord.Member]:
+        """
+        Looks a member up by username or display name in O(1). If several
+        members share the name, returns the first one indexed, like a scan of
+        guild.members would.
+        """
+        if self._name_index is None:
+            self._name_index = {}
+            for member in guild.members:
+                self._index_member(member)
+        matches = self._name_index.get(name)
+        return next(iter(matches.values())) if matches else None
+
+    def _index_member(self, member: discord.Member) -> None:
+        if self._name_index is not None:
+            for key in (member.name, member.display_name):
+                self._name_index.setdefault(key, {})[member.id] = member
+
+    def _unindex_member(self, member: Union[discord.Member, discord.User]) -> None:
+        if self._name_index is not None:
+            for key in (member.name, member.display_name):
+                matches = self._name_index.get(key)
+                if matches is not None:
+                    matches.pop(member.id, None)
+                    if not matches:
+                        del self._name_index[key]
+
+    def handle_member_rename(
+        self, before: Union[discord.Member, discord.User], after: discord.Member
+    ) -> None:
+        """Called when a member's username or display name changes."""
+        self._unindex_member(before)
+        self._index_member(after)
+
+    def _get_chat_channel(self) -> Optional[discord.TextChannel]:
+        """Returns the configured chat channel, resolving it once and caching it."""
+        if self._chat_channel is None:
+            self._chat_channel = self.bot.get_channel(self.bot_config.CHAT_CHANNEL_ID)
+        return self._chat_channel
+
+    def handle_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
+        """Drops cached channel references when the channel they point to is deleted."""
+        if self._chat_channel is not None and channel.id == self._chat_channel.id:
+            self._chat_channel = None
+        if self._events_webhook is not None and channel.id == self._events_webhook.channel_id:
+            self._events_webhook = None
+
+    async def _get_events_webhook(
+        self, channel: discord.TextChannel
+    ) -> Optional[discord.Webhook]:
+        """
+        Returns the bot's event webhook for `channel`, reusing an existing one
+        from a previous run or creating it on first use. Returns None when
+        EVENTS_WEBHOOK is off or the bot lacks Manage Webhooks.
+        """
+        if not self.bot_config.EVENTS_WEBHOOK or self._events_webhook_disabled:
+            return None
+        if self._events_webhook and self._events_webhook.channel_id == channel.id:
+            return self._events_webhook
+        async with self._events_webhook_lock:
+            # Another event may have finished the lookup while we waited
+            if self._events_webhook_disabled:
+                return None
+            if self._events_webhook and self._events_webhook.channel_id == channel.id:
+                return self._events_webhook
+            try:
+                for webhook in await channel.webhooks():
+                    if (
+                        webhook.name == self.EVENTS_WEBHOOK_NAME
+                        and webhook.token
+                        and webhook.user
+                        and webhook.user.id == self.bot.user.id
+                    ):
+                        self._events_webhook = webhook
+                        break
+                else:
+                    self._events_webhook = await channel.create_webhook(
+                        name=self.EVENTS_WEBHOOK_NAME
+                    )
+            except discord.Forbidden:
+                logger.warning(
+                    f"Missing Manage Webhooks in #{channel.name}; sending event embeds directly."
+                )
+                self._events_webhook_disabled = True
+                return None
+            except discord.HTTPException as e:
+                logger.error(f"Failed to set up events webhook: {e}")
+                return None
+            return self._events_webhook
+
+    async def _send_event_embed(
+        self, channel: discord.TextChannel, embed: discord.Embed
+    ) -> None:
+        """
+        Sends a join/leave/moderation embed via the events webhook when
+        EVENTS_WEBHOOK is on, otherwise (or if the webhook is unavailable)
+        as a normal channel message.
+        """
+        webhook = await self._get_events_webhook(channel)
+        if webhook:
+            try:
+                await webhook.send(
+                    embed=embed,
+                    username=self.bot.user.name,
+                    avatar_url=self.bot.user.display_avatar.url,
+                )
+                return
+            except discord.NotFound:
+                self._events_webhook = None  # Deleted; recreate on the next event
+            except discord.HTTPException as e:
+                logger.warning(f"Events webhook send failed, using channel: {e}")
+        await channel.send(embed=embed)
+
+    async def _get_banner_url(
+        self, user: Union[discord.Member, discord.User]
+    ) -> Optional[str]:
+        """
+        Returns a user's banner URL (or None). Banners are usually only present
+        on a fetched user, so results are cached for BANNER_CACHE_TTL_SECONDS
+        to avoid a REST call on every notification embed.
+        """
+        user_id = user.id
+        # Use the banner directly if this object already carries one
+        if (banner := getattr(user, "banner", None)):
+            return banner.url
+        now = time.monotonic()
+        cached = self._banner_cache.get(user_id)
+        if cached and now - cached[1] < self.BANNER_CACHE_TTL_SECONDS:
+            return cached[0]
+        try:
+            user_obj = await self.bot.fetch_user(user_id)
+        except Exception as e:
+            logger.debug(f"Could not fetch banner for user {user_id}: {e}")
+            return None  # Not cached, so the next event retries
+        banner_url = user_obj.banner.url if user_obj.banner else None
+        # Re-insert at the end so the dict stays ordered oldest-first
+        self._banner_cache.pop(user_id, None)
+        self._banner_cache[user_id] = (banner_url, now)
+        if len(self._banner_cache) > self.BANNER_CACHE_MAX_ENTRIES:
+            del self._banner_cache[next(iter(self._banner_cache))]
+        return banner_url
+
+    async def _rate_limited_send(
+        self, destination: Any, *args, **kwargs
+    ) -> Optional[discord.Message]:
+        """
+        Sends a message through the shared rate limiter. discord.py already
+        waits out 429s and retries 5xx responses itself, so no retry here.
+        """
+        async with self.send_limiter:
+            return await destination.send(*args, **kwargs)
+
+    async def _confirm(self, ctx, text: str) -> Optional[bool]:
+        """
+        Asks the invoking user to confirm with buttons. Returns True/False
+        once answered or None on timeout; the prompt is deleted either way.
+        """
+        view = ConfirmView(ctx.author.id)
+        prompt = await ctx.send(text, view=view)
+        try:
+            await view.wait()
+        finally:
+            # Nobody needs to wait on the DELETE round-trip
+            self._spawn(self._safe_delete(prompt))
+        return view.result
+
+    @staticmethod
+    async def _safe_delete(message: discord.Message) -> None:
+        """Best-effort message delete for fire-and-forget cleanup."""
+        try:
+            await message.delete()
+        except Exception:
+            pass
+
+    async def _send_chunks(self, destination: Any, chunks: List[Any]) -> None:
+        """
+        Sends a mix of text and embed chunks, packing consecutive embeds into
+        as few messages as Discord allows (10 embeds / 6000 chars per message).
+        """
+        batch: List[discord.Embed] = []
+        batch_length = 0
+
+        async def flush():
+            nonlocal batch, batch_length
+            if batch:
+                await self._rate_limited_send(destination, embeds=batch)
+                batch, batch_length = [], 0
+
+        for chunk in chunks:
+            if isinstance(chunk, discord.Embed):
+                chunk_length = len(chunk)
+                if len(batch) >= 10 or batch_length + chunk_length > 6000:
+                    await flush()
+                batch.append(chunk)
+                batch_length += chunk_length
+            else:
+                await flush()
+                await self._rate_limited_send(destination, chunk)
+        await flush()
+
     # --- Event Handlers ---
 
     def get_active_vote_in_channel(self, channel_id: int) -> Optional[int]:
@@ -1025,14 +1626,12 @@ class BotHelper:
             async with self.state.moderation_lock:
                 for mid in ids_to_remove:
                     self.state.active_votes.pop(mid, None)
-            if self.save_state:
-                await self.save_state()
+            self.request_save()
 
     @handle_errors
     async def start_vote(self, ctx, args: str):
         """!vote command implementation."""
-        record_command_usage(self.state.analytics, "!vote")
-        record_command_usage_by_user(self.state.analytics, ctx.author.id, "!vote")
+        record_command_usage_full(self.state.analytics, ctx.author.id, "!vote")
 
         # Use shlex to handle quoted arguments correctly if needed, but split is fine for mentions
         args_list = args.split()
@@ -1128,7 +1727,7 @@ class BotHelper:
                 "duration_hours": duration
             }
         
-        if self.save_state: await self.save_state()
+        self.request_save()
         logger.info(f"Started persistent vote {msg.id}")
 
     async def end_vote(self, message_id: int):
@@ -1225,16 +1824,17 @@ class BotHelper:
             # Use .pop to be safe against key errors
             self.state.active_votes.pop(message_id, None)
         
-        if self.save_state: await self.save_state()
+        self.request_save()
 
     @handle_errors
     async def handle_member_join(self, member: discord.Member) -> None:
         """Called by on_member_join event."""
         if member.guild.id != self.bot_config.GUILD_ID:
             return
+        self._index_member(member)
 
         # Send join announcement
-        chat_channel = member.guild.get_channel(self.bot_config.CHAT_CHANNEL_ID)
+        chat_channel = self._get_chat_channel()
         if chat_channel:
             embed = discord.Embed(
                 description=f"{member.mention} **JOINED the SERVER**!",
@@ -1242,24 +1842,19 @@ class BotHelper:
             )
             embed.set_author(name=member.name, icon_url=member.display_avatar.url)
             embed.set_thumbnail(url=member.display_avatar.url)
-            try:
-                user_obj = await self.bot.fetch_user(member.id)
-                if user_obj and user_obj.banner:
-                    embed.set_image(url=user_obj.banner.url)
-            except Exception as e:
-                logger.warning(
-                    f"Could not fetch banner for new member {member.name}: {e}"
-                )
+            if (banner_url := await self._get_banner_url(member)):
+                embed.set_image(url=banner_url)
             
             embed.add_field(
                 name="Account Age", value=get_discord_age(member.created_at), inline=True
             )
-            await chat_channel.send(embed=embed)
+            await self._send_event_embed(chat_channel, embed)
 
         # Log join to state
+        now = datetime.now(timezone.utc)
         async with self.state.moderation_lock:
             self.state.recent_joins.append(
-                (member.id, member.name, member.display_name, datetime.now(timezone.utc))
+                (member.id, member.name, member.display_name, now, int(now.timestamp()))
             )
         
         logger.info(
@@ -1271,7 +1866,7 @@ class BotHelper:
         self, member: discord.Member, reason: str, moderator_name: str
     ) -> None:
         """Sends an announcement when a user is moved to the punishment VC."""
-        chat_channel = member.guild.get_channel(self.bot_config.CHAT_CHANNEL_ID)
+        chat_channel = self._get_chat_channel()
         if not chat_channel:
             return
 
@@ -1281,20 +1876,13 @@ class BotHelper:
         )
         embed.set_author(name=f"{member.name}", icon_url=member.display_avatar.url)
         embed.set_thumbnail(url=member.display_avatar.url)
-        try:
-            user_obj = await self.bot.fetch_user(member.id)
-            if user_obj.banner:
-                embed.set_image(url=user_obj.banner.url)
-        except Exception as e:
-            logger.warning(
-                f"Could not fetch user banner for punishment notification: {e}"
-            )
-            pass
+        if (banner_url := await self._get_banner_url(member)):
+            embed.set_image(url=banner_url)
         
         embed.add_field(name="Moved By", value=moderator_name, inline=True)
         final_reason = reason or "No reason provided"
         embed.add_field(name="Reason", value=final_reason, inline=False)
-        await chat_channel.send(embed=embed)
+        await self._send_event_embed(chat_channel, embed)
 
     @handle_errors
     async def send_timeout_notification(
@@ -1305,7 +1893,7 @@ class BotHelper:
         reason: str = None,
     ) -> None:
         """Sends an announcement when a user is timed out."""
-        chat_channel = member.guild.get_channel(self.bot_config.CHAT_CHANNEL_ID)
+        chat_channel = self._get_chat_channel()
         if not chat_channel:
             return
 
@@ -1316,37 +1904,29 @@ class BotHelper:
         )
         embed.set_author(name=f"{member.name}", icon_url=member.display_avatar.url)
         embed.set_thumbnail(url=member.display_avatar.url)
-        try:
-            user_obj = await self.bot.fetch_user(member.id)
-            if user_obj.banner:
-                embed.set_image(url=user_obj.banner.url)
-        except Exception:
-            pass
+        if (banner_url := await self._get_banner_url(member)):
+            embed.set_image(url=banner_url)
         
         embed.add_field(name="Duration", value=duration_str, inline=True)
-        roles = [
-            role.mention for role in member.roles if role.name != "@everyone"
-        ]
-        if roles:
-            roles.reverse()
-            roles_str = " ".join(roles)
+        roles_str = _role_mention_string(member)
+        if roles_str:
             embed.add_field(name="Roles", value=roles_str, inline=True)
         
         embed.add_field(name="Moderator", value=moderator.mention, inline=True)
         final_reason = reason or "No reason provided"
         embed.add_field(name="Reason", value=final_reason, inline=False)
-        await chat_channel.send(embed=embed)
+        await self._send_event_embed(chat_channel, embed)
 
     @handle_errors
     async def send_timeout_removal_notification(
         self, member: discord.Member, duration: int, reason: str = "Expired Naturally"
     ) -> None:
         """Sends an announcement when a user's timeout is removed."""
-        async with self.state.moderation_lock:
+        async with self.state.moderation_lock.reader_lock:
             if not self.state.notifications_enabled:
                 return
         
-        chat_channel = member.guild.get_channel(self.bot_config.CHAT_CHANNEL_ID)
+        chat_channel = self._get_chat_channel()
         if not chat_channel:
             return
 
@@ -1357,12 +1937,8 @@ class BotHelper:
         )
         embed.set_author(name=f"{member.name}", icon_url=member.display_avatar.url)
         embed.set_thumbnail(url=member.display_avatar.url)
-        try:
-            user_obj = await self.bot.fetch_user(member.id)
-            if user_obj.banner:
-                embed.set_image(url=user_obj.banner.url)
-        except Exception:
-            pass
+        if (banner_url := await self._get_banner_url(member)):
+            embed.set_image(url=banner_url)
 
         embed.add_field(name="Duration", value=duration_str, inline=True)
         
@@ -1372,10 +1948,7 @@ class BotHelper:
                 parts = reason.rsplit("by", 1)
                 reason_text = parts[0].strip()
                 mod_name = parts[1].strip().lstrip("🛡️").strip()
-                mod_member = discord.utils.find(
-                    lambda m: m.name == mod_name or m.display_name == mod_name,
-                    member.guild.members,
-                )
+                mod_member = self._find_member_by_name(member.guild, mod_name)
                 mod_display = mod_member.mention if mod_member else mod_name
                 reason = f"{reason_text} by {mod_display}"
             except Exception as e:
@@ -1384,20 +1957,18 @@ class BotHelper:
                 )
         
         embed.add_field(name="Reason", value=f"{reason}", inline=False)
-        await chat_channel.send(embed=embed)
+        await self._send_event_embed(chat_channel, embed)
 
     @handle_errors
     async def send_unban_notification(
         self, user: discord.User, moderator: discord.User
     ) -> None:
         """Sends an announcement when a user is unbanned."""
-        async with self.state.moderation_lock:
+        async with self.state.moderation_lock.reader_lock:
             if not self.state.notifications_enabled:
                 return
         
-        chat_channel = self.bot.get_guild(self.bot_config.GUILD_ID).get_channel(
-            self.bot_config.CHAT_CHANNEL_ID
-        )
+        chat_channel = self._get_chat_channel()
         if chat_channel:
             embed = discord.Embed(
                 description=f"{user.mention} **UNBANNED**",
@@ -1405,23 +1976,68 @@ class BotHelper:
             )
             embed.set_author(name=user.name, icon_url=user.display_avatar.url)
             embed.set_thumbnail(url=user.display_avatar.url)
-            try:
-                user_obj = await self.bot.fetch_user(user.id)
-                if user_obj.banner:
-                    embed.set_image(url=user_obj.banner.url)
-            except Exception:
-                pass
+            if (banner_url := await self._get_banner_url(user)):
+                embed.set_image(url=banner_url)
             
             embed.add_field(name="Moderator", value=moderator.mention, inline=True)
-            await chat_channel.send(embed=embed)
+            await self._send_event_embed(chat_channel, embed)
             
             # Log unban to state
+            now = datetime.now(timezone.utc)
             async with self.state.moderation_lock:
                 self.state.recent_unbans.append(
-                    (user.id, user.name, user.display_name, datetime.now(timezone.utc), moderator.name)
+                    (user.id, user.name, user.display_name, now, moderator.name, int(now.timestamp()))
                 )
-                if len(self.state.recent_unbans) > 100:
-                    self.state.recent_unbans.pop(0)
+
+    def handle_audit_log_entry(self, entry: discord.AuditLogEntry) -> None:
+        """
+        Called by on_audit_log_entry_create. Caches ban/unban/kick entries
+        and wakes any handler waiting on that (action, target) pair.
+        """
+        if entry.guild.id != self.bot_config.GUILD_ID or entry.action not in (
+            discord.AuditLogAction.ban,
+            discord.AuditLogAction.unban,
+            discord.AuditLogAction.kick,
+        ):
+            return
+        self._audit_feed_active = True
+        if not entry.target:
+            return
+        key = (entry.action, entry.target.id)
+        self._audit_cache.pop(key, None)
+        self._audit_cache[key] = entry
+        if len(self._audit_cache) > self.AUDIT_CACHE_MAX_ENTRIES:
+            self._audit_cache.popitem(last=False)
+        if (waiter := self._audit_waiters.get(key)):
+            waiter.set()
+
+    async def _wait_for_audit_entry(
+        self, action: discord.AuditLogAction, target_id: int, timeout: float
+    ) -> Optional[discord.AuditLogEntry]:
+        """
+        Returns the cached audit log entry for `action` on `target_id`, waiting
+        up to `timeout` seconds for the gateway to deliver it. Returns None on
+        a miss; callers fall back to querying the audit log.
+        """
+        key = (action, target_id)
+        if key not in self._audit_cache:
+            waiter = self._audit_waiters.setdefault(key, asyncio.Event())
+            try:
+                await asyncio.wait_for(waiter.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                self._audit_waiters.pop(key, None)
+        entry = self._audit_cache.pop(key, None)
+        if entry is not None and entry.user is None and entry.user_id:
+            # The gateway payload only carries an ID for uncached moderators
+            entry.user = self.bot.get_user(entry.user_id)
+            if entry.user is None:
+                try:
+                    entry.user = await self.bot.fetch_user(entry.user_id)
+                except discord.HTTPException:
+                    pass
+        return entry
 
     @handle_errors
     async def handle_member_ban(self, guild: discord.Guild, user: discord.User) -> None:
@@ -1439,39 +2055,66 @@ class BotHelper:
             )
             return
 
-        reason, moderator_name = ("No reason provided", "Unknown")
+        # Flag the ban before any await so handle_member_remove (which only
+        # waits 1.5s) sees it regardless of audit log or lock latency. Only
+        # flag users whose removal is still to come or being waited on, so a
+        # ban of a non-member doesn't leave a marker behind for a later leave.
+        details = None
+        if user.id in self.state.ban_signals or guild.get_member(user.id) is not None:
+            self.state.recently_banned_ids.add(user.id)
+            # Resolved below once the audit lookup finishes, so the remove
+            # handler reuses this lookup instead of racing it for the entry
+            details = asyncio.get_running_loop().create_future()
+            self.state.recent_ban_details[user.id] = details
+            self.state.ban_signals.setdefault(user.id, asyncio.Event()).set()
+
+        reason, moderator_name, moderator_mention = ("No reason provided", "Unknown", "Unknown")
         try:
-            logger.debug(f"Attempting to fetch audit log for ban of {user.name}")
-            # Look for the ban action in the audit log
-            async for entry in guild.audit_logs(limit=1, action=discord.AuditLogAction.ban):
-                logger.debug(
-                    f"Audit log entry found: Target={entry.target}, User={entry.user}"
-                )
-                if entry.target and entry.target.id == user.id:
-                    moderator_name = entry.user.name if entry.user else "Unknown"
-                    reason = entry.reason or "No reason provided"
+            entry = await self._wait_for_audit_entry(
+                discord.AuditLogAction.ban,
+                user.id,
+                timeout=1.0 if self._audit_feed_active else 0,
+            )
+            if entry is None:
+                logger.debug(f"Attempting to fetch audit log for ban of {user.name}")
+                # Look for the ban action in the audit log
+                async for candidate in guild.audit_logs(limit=1, action=discord.AuditLogAction.ban):
                     logger.debug(
-                        f"Found matching audit log entry for {user.name}. Mod: {moderator_name}, Reason: {reason}"
+                        f"Audit log entry found: Target={candidate.target}, User={candidate.user}"
                     )
-                    break
+                    if candidate.target and candidate.target.id == user.id:
+                        entry = candidate
+                        break
+            if entry is not None:
+                moderator_name = getattr(entry.user, "name", "Unknown")
+                moderator_mention = getattr(entry.user, "mention", "Unknown")
+                reason = entry.reason or "No reason provided"
+                logger.debug(
+                    f"Found matching audit log entry for {user.name}. Mod: {moderator_name}, Reason: {reason}"
+                )
         except discord.Forbidden:
             logger.error(
                 "handle_member_ban failed: Missing permissions to view audit logs."
             )
         except Exception as e:
             logger.error(f"Could not fetch audit log for ban: {e}", exc_info=True)
+        finally:
+            if details is not None and not details.done():
+                details.set_result((moderator_mention, reason))
 
         try:
             # Log the ban to our internal state
             async with self.state.moderation_lock:
-                self.state.recently_banned_ids.add(user.id)
+                self.state.ban_list_cache = None
+                now = datetime.now(timezone.utc)
                 self.state.recent_bans.append(
                     (
                         user.id,
                         user.name,
-                        getattr(user, "display_name", user.name),
-                        datetime.now(timezone.utc),
+                        user.display_name,
+                        now,
                         reason,
+                        int(now.timestamp()),
                     )
                 )
                 logger.info(
@@ -1479,12 +2122,12 @@ class BotHelper:
                 )
                 if self.save_state:
                     # Save state immediately to prevent race condition with on_member_remove
-                    asyncio.create_task(self.save_state())
+                    self._spawn(self.save_state())
                     logger.debug(
                         "Triggered state save after adding ban ID to fix race condition."
                     )
                     
-            asyncio.create_task(self.update_timeouts_report_menu())        
+            self._spawn(self.update_timeouts_report_menu())        
             
         except Exception as state_e:
             logger.critical(
@@ -1500,12 +2143,21 @@ class BotHelper:
         if guild.id != self.bot_config.GUILD_ID:
             return
         
-        await asyncio.sleep(4)  # Wait for audit log to update
-        
-        async for entry in guild.audit_logs(limit=5, action=discord.AuditLogAction.unban):
-            if entry.target.id == user.id:
-                await self.send_unban_notification(user, entry.user)
-                return
+        self.state.ban_list_cache = None
+
+        # The gateway usually pushes the entry within moments of the unban
+        entry = await self._wait_for_audit_entry(
+            discord.AuditLogAction.unban, user.id, timeout=4.0
+        )
+        if entry is not None and entry.user is not None:
+            await self.send_unban_notification(user, entry.user)
+            return
+        if not self._audit_feed_active:
+            # No audit log events arriving (intent/permission); query once instead
+            async for entry in guild.audit_logs(limit=3, action=discord.AuditLogAction.unban):
+                if entry.target.id == user.id:
+                    await self.send_unban_notification(user, entry.user)
+                    return
         
         logger.warning(
             f"Unban for {user.name} detected, but audit log entry not found."
@@ -1521,44 +2173,64 @@ class BotHelper:
         """
         if member.guild.id != self.bot_config.GUILD_ID:
             return
+        self._unindex_member(member)
 
-        await asyncio.sleep(4)  # Wait for audit logs / ban flag
-        
-        guild = member.guild
-        chat_channel = guild.get_channel(self.bot_config.CHAT_CHANNEL_ID)
-        if not chat_channel:
+        # Returns immediately if on_member_ban already fired, otherwise waits
+        # a short grace period for it before treating this as a kick/leave.
+        ban_signal = self.state.ban_signals.setdefault(member.id, asyncio.Event())
+        try:
+            await asyncio.wait_for(ban_signal.wait(), timeout=1.5)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            self.state.ban_signals.pop(member.id, None)
+        
+        guild = member.guild
+        chat_channel = self._get_chat_channel()
+        if not chat_channel:
             return
 
         # --- Check 1: Was this a BAN? ---
-        async with self.state.moderation_lock:
-            is_banned = member.id in self.state.recently_banned_ids
+        # Plain set/bool reads are atomic on the event loop; no lock needed
+        is_banned = member.id in self.state.recently_banned_ids
+        if is_banned:
+            # Each ban produces exactly one removal; consume the marker
+            self.state.recently_banned_ids.discard(member.id)
         
         if is_banned:
-            # It was a ban. Fetch audit log to get the moderator and reason.
-            # We do this here (instead of handle_member_ban) to ensure we have the full context
+            # It was a ban. Reuse the moderator and reason that handle_member_ban
+            # pulls from the audit log (it consumes the pushed entry, so waiting
+            # on the feed here would only time out); re-query only on a miss.
             try:
-                found_ban_entry = False
-                async for entry in guild.audit_logs(limit=5, action=discord.AuditLogAction.ban):
-                    if entry.target.id == member.id:
-                        found_ban_entry = True
-                        reason = entry.reason or "No reason provided"
-                        embed = await self._create_departure_embed(
-                            member, entry.user, reason, "BANNED", discord.Color.red()
-                        )
-                        
-                        async with self.state.moderation_lock:
-                            notifications_are_enabled = self.state.notifications_enabled
-
-                        if notifications_are_enabled:
-                            await chat_channel.send(embed=embed)
-                        
-                        logger.info(f"Processed departure for {member.name} as BAN.")
-                        break
-                
-                if not found_ban_entry:
-                    # Fallback if audit log is too slow or missing (uses data from handle_member_ban state if available)
+                ban_details = self.state.recent_ban_details.pop(member.id, None)
+
+                moderator: Any = None
+                reason = "No reason provided"
+                if ban_details is not None:
+                    mention, reason = await ban_details
+                    if mention != "Unknown":
+                        moderator = mention
+                if moderator is None:
+                    async for entry in guild.audit_logs(limit=5, action=discord.AuditLogAction.ban):
+                        if entry.target.id == member.id:
+                            moderator = entry.user
+                            reason = entry.reason or "No reason provided"
+                            break
+
+                if moderator is not None:
+                    embed = await self._create_departure_embed(
+                        member, moderator, reason, "BANNED", discord.Color.red()
+                    )
+                    
+                    notifications_are_enabled = self.state.notifications_enabled
+
+                    if notifications_are_enabled:
+                        await self._send_event_embed(chat_channel, embed)
+                    
+                    logger.info(f"Processed departure for {member.name} as BAN.")
+                else:
+                    # Fallback if audit log is too slow or missing
                     logger.warning(f"Ban detected for {member.name} via state, but audit log entry was elusive.")
-                    # You could optionally send a generic ban message here if you wish
             
             except Exception as e:
                 logger.error(f"Error processing ban notification in remove handler: {e}")
@@ -1568,48 +2240,53 @@ class BotHelper:
 
         # --- Check 2: Was this a KICK? ---
         try:
-            async for entry in guild.audit_logs(
-                limit=20,  # FIX: Increased from 3 to 20 to prevent missing logs in busy servers
-                action=discord.AuditLogAction.kick,
-                after=member.joined_at or datetime.now(timezone.utc) - timedelta(minutes=5),
-            ):
-                if (
-                    entry.target
-                    and entry.target.id == member.id
+            # Once audit log events are flowing, the kick entry arrives by push;
+            # otherwise look it up in the audit log as before
+            entry = await self._wait_for_audit_entry(
+                discord.AuditLogAction.kick,
+                member.id,
+                timeout=1.0 if self._audit_feed_active else 0,
+            )
+            if entry is None and not self._audit_feed_active:
+                async for candidate in guild.audit_logs(
+                    limit=20,  # FIX: Increased from 3 to 20 to prevent missing logs in busy servers
+                    action=discord.AuditLogAction.kick,
+                    after=member.joined_at or datetime.now(timezone.utc) - timedelta(minutes=5),
                 ):
-                    reason = entry.reason or "No reason provided"
-                    embed = await self._create_departure_embed(
-                        member, entry.user, reason, "KICKED", discord.Color.orange()
-                    )
-                    
-                    async with self.state.moderation_lock:
-                        notifications_are_enabled = self.state.notifications_enabled
-                    
-                    if notifications_are_enabled:
-                        await chat_channel.send(embed=embed)
-                    
-                    logger.info(f"Processed departure for {member.name} as KICK.")
-                    
-                    # Log kick to state
-                    async with self.state.moderation_lock:
-                        roles = [
-                            role.mention
-                            for role in member.roles
-                            if role.name != "@everyone"
-                        ]
-                        self.state.recent_kicks.append(
-                            (
-                                member.id,
-                                member.name,
-                                member.display_name,
-                                datetime.now(timezone.utc),
-                                reason,
-                                entry.user.mention,
-                                " ".join(roles),
-                            )
+                    if candidate.target and candidate.target.id == member.id:
+                        entry = candidate
+                        break
+            if entry is not None:
+                reason = entry.reason or "No reason provided"
+                embed = await self._create_departure_embed(
+                    member, entry.user, reason, "KICKED", discord.Color.orange()
+                )
+            
+                notifications_are_enabled = self.state.notifications_enabled
+            
+                if notifications_are_enabled:
+                    await self._send_event_embed(chat_channel, embed)
+            
+                logger.info(f"Processed departure for {member.name} as KICK.")
+            
+                # Log kick to state
+                async with self.state.moderation_lock:
+                    roles = _role_mentions(member)
+                    now = datetime.now(timezone.utc)
+                    self.state.recent_kicks.append(
+                        (
+                            member.id,
+                            member.name,
+                            member.display_name,
+                            now,
+                            reason,
+                            entry.user.mention,
+                            " ".join(roles),
+                            int(now.timestamp()),
                         )
-                    asyncio.create_task(self.update_timeouts_report_menu())    
-                    return
+                    )
+                self._spawn(self.update_timeouts_report_menu())    
+                return
         except discord.Forbidden:
             logger.warning("Missing permissions to check audit log for kicks.")
         except Exception as e:
@@ -1617,9 +2294,7 @@ class BotHelper:
 
         # --- Check 3: This must be a LEAVE ---
         logger.info(f"Buffering LEAVE for {member.name}.")
-        roles_list = [
-            role.mention for role in member.roles if role.name != "@everyone"
-        ]
+        roles_list = _role_mentions(member)
         roles_list.reverse()
         role_string_for_db = " ".join(roles_list) if roles_list else "No roles"
 
@@ -1633,14 +2308,16 @@ class BotHelper:
         }
 
         # Add to state and schedule the batch processor
+        now = datetime.now(timezone.utc)
         async with self.state.moderation_lock:
             self.state.recent_leaves.append(
                 (
                     member.id,
                     member.name,
                     member.display_name,
-                    datetime.now(timezone.utc),
+                    now,
                     role_string_for_db,
+                    int(now.timestamp()),
                 )
             )
             if self.state.leave_batch_task:
@@ -1656,43 +2333,37 @@ class BotHelper:
     async def send_help_menu(self, target: Any) -> None:
         """Sends the persistent Omegle help menu with buttons."""
         try:
-            help_description = (
-                "\n**Pause** --------- Pause Omegle\n"
-                "**Skip** ----------- Skip/Start Omegle\n"
-                "**Rules** ---------- Shows Server Rules\n"
-                "**Report** -------- Report Omegle User\n"
-                "**!commands** --- List All Commands\n"
-            )
-            embed = discord.Embed(
-                title="👤  Omegle Controls  👤",
-                description=help_description,
-                color=discord.Color.blue(),
-            )
             destination = target.channel if hasattr(target, "channel") else target
             if destination and hasattr(destination, "send"):
-                await destination.send(embed=embed, view=HelpView(self))
+                await destination.send(embed=_HELP_EMBED.copy(), view=HelpView(self))
         except Exception as e:
             logger.error(f"Error in send_help_menu: {e}", exc_info=True)
 
     @handle_errors
     async def show_bans(self, ctx) -> None:
         """!bans command implementation (Sorted Alphabetically by Username)."""
-        record_command_usage(self.state.analytics, "!bans")
-        record_command_usage_by_user(self.state.analytics, ctx.author.id, "!bans")
+        record_command_usage_full(self.state.analytics, ctx.author.id, "!bans")
         
         # 1. Fetch bans
         # We use a status message because fetching a large ban list can take a second
         status_msg = await ctx.send("⏳ Fetching ban list...")
         
-        ban_entries = [entry async for entry in ctx.guild.bans()]
+        cache = self.state.ban_list_cache
+        if cache and time.monotonic() - cache[0] < self.BAN_CACHE_TTL_SECONDS:
+            ban_entries = cache[1]
+        else:
+            # 2. Sort alphabetically by username (Case-Insensitive), once per fetch
+            # casefold() so 'Zebra' doesn't come before 'apple', Unicode-aware
+            ban_entries = sorted(
+                [entry async for entry in ctx.guild.bans()],
+                key=lambda entry: entry.user.name.casefold(),
+            )
+            self.state.ban_list_cache = (time.monotonic(), ban_entries)
+
         if not ban_entries:
             await status_msg.edit(content="No users are currently banned.")
             return
 
-        # 2. Sort alphabetically by username (Case-Insensitive)
-        # We use .lower() so 'Zebra' doesn't come before 'apple'
-        ban_entries.sort(key=lambda entry: entry.user.name.lower())
-
         def process_ban(entry):
             user = entry.user
             reason = entry.reason or "No reason provided"
@@ -1720,27 +2391,30 @@ class BotHelper:
     async def show_top_members(self, ctx) -> None:
         """!top command implementation."""
         await ctx.send("Gathering member data, this may take a moment...")
-        members = list(ctx.guild.members)
+        members = ctx.guild.members
         
+        # Single bounded-heap passes instead of sorting the whole member list twice
         # Top 10 by server join date
-        joined_members = sorted(
-            [m for m in members if m.joined_at], key=lambda m: m.joined_at
-        )[:10]
+        joined_members = heapq.nsmallest(
+            10, (m for m in members if m.joined_at), key=attrgetter("joined_at")
+        )
         # Top 10 by account creation date
-        created_members = sorted(members, key=lambda m: m.created_at)[:10]
+        created_members = heapq.nsmallest(10, members, key=attrgetter("created_at"))
+
+        # Look up banners once, in parallel, deduped by ID; the banner cache
+        # means repeat !top calls within the TTL skip the API entirely
+        unique_members = list({m.id: m for m in joined_members + created_members}.values())
+        banner_urls = dict(
+            zip(
+                (m.id for m in unique_members),
+                await asyncio.gather(*(self._get_banner_url(m) for m in unique_members)),
+            )
+        )
 
-        async def create_member_embed(
-            member, rank, color, show_join_date=True
+        def create_member_embed(
+            member, rank, color, banner_url, show_join_date=True
         ):
             """Helper to build a rich embed for a member."""
-            user_obj = member
-            try:
-                fetched_user = await self.bot.fetch_user(member.id)
-                if fetched_user:
-                    user_obj = fetched_user
-            except Exception:
-                pass  # Ignore if fetch fails
-            
             embed = discord.Embed(
                 title=f"#{rank} - {member.display_name}",
                 description=f"{member.mention}",
@@ -1751,8 +2425,8 @@ class BotHelper:
                 icon_url=member.display_avatar.url,
             )
             embed.set_thumbnail(url=member.display_avatar.url)
-            if hasattr(user_obj, "banner") and user_obj.banner:
-                embed.set_image(url=user_obj.banner.url)
+            if banner_url:
+                embed.set_image(url=banner_url)
 
             embed.add_field(
                 name="Account Created",
@@ -1766,9 +2440,7 @@ class BotHelper:
                     inline=True,
                 )
             
-            roles = [
-                role.mention for role in member.roles if role.name != "@everyone"
-            ]
+            roles = _role_mentions(member)
             if roles:
                 role_str = " ".join(roles)
                 if len(role_str) > 1024:
@@ -1778,25 +2450,33 @@ class BotHelper:
                 )
             return embed
 
-        await ctx.send("**🏆 Top 10 Oldest Server Members (by join date)**")
+        # Build everything first, then let _send_chunks pack the embeds into
+        # as few messages as possible instead of one send per member
+        chunks: List[Any] = ["**🏆 Top 10 Oldest Server Members (by join date)**"]
         if not joined_members:
-            await ctx.send("No members with join dates found in the server.")
+            chunks.append("No members with join dates found in the server.")
         else:
-            for i, member in enumerate(joined_members, 1):
-                embed = await create_member_embed(member, i, discord.Color.gold())
-                await ctx.send(embed=embed)
+            chunks.extend(
+                create_member_embed(
+                    member, i, discord.Color.gold(), banner_urls.get(member.id)
+                )
+                for i, member in enumerate(joined_members, 1)
+            )
 
-        await ctx.send("**🕰️ Top 10 Oldest Discord Accounts (by creation date)**")
-        for i, member in enumerate(created_members, 1):
-            embed = await create_member_embed(member, i, discord.Color.blue())
-            await ctx.send(embed=embed)
+        chunks.append("**🕰️ Top 10 Oldest Discord Accounts (by creation date)**")
+        chunks.extend(
+            create_member_embed(
+                member, i, discord.Color.blue(), banner_urls.get(member.id)
+            )
+            for i, member in enumerate(created_members, 1)
+        )
+        await self._send_chunks(ctx, chunks)
 
     @handle_errors
     async def show_info(self, ctx) -> None:
         """!info command implementation."""
         command_name = f"!{(ctx.invoked_with if hasattr(ctx, 'invoked_with') else 'info')}"
-        record_command_usage(self.state.analytics, command_name)
-        record_command_usage_by_user(self.state.analytics, ctx.author.id, command_name)
+        record_command_usage_full(self.state.analytics, ctx.author.id, command_name)
         
         for msg in self.bot_config.INFO_MESSAGES:
             await ctx.send(msg)
@@ -1804,18 +2484,23 @@ class BotHelper:
     @handle_errors
     async def list_roles(self, ctx) -> None:
         """!roles command implementation."""
-        record_command_usage(self.state.analytics, "!roles")
-        record_command_usage_by_user(self.state.analytics, ctx.author.id, "!roles")
+        record_command_usage_full(self.state.analytics, ctx.author.id, "!roles")
         
-        for role in sorted(ctx.guild.roles, key=lambda r: r.position, reverse=True):
-            if role.name != "@everyone" and role.members:
+        def process_member(member):
+            return f"{member.display_name} ({member.name}#{member.discriminator})"
+
+        # guild.roles is already ordered by position (lowest first)
+        default_role_id = ctx.guild.id
+        for role in reversed(ctx.guild.roles):
+            if role.id == default_role_id:
+                continue
+            # role.members is recomputed from the member cache on every access
+            role_members = role.members
+            if role_members:
                 sorted_members = sorted(
-                    role.members, key=lambda m: m.name.lower()
+                    role_members, key=lambda m: m.name.casefold()
                 )
                 
-                def process_member(member):
-                    return f"{member.display_name} ({member.name}#{member.discriminator})"
-                
                 embeds = create_message_chunks(
                     entries=sorted_members,
                     title=f"Role: {role.name}",
@@ -1827,27 +2512,27 @@ class BotHelper:
                 for i, embed in enumerate(embeds):
                     if len(embeds) > 1:
                         embed.title = f"{embed.title} (Part {i + 1})"
-                    embed.set_footer(text=f"Total members: {len(role.members)}")
+                    embed.set_footer(text=f"Total members: {len(role_members)}")
                     await ctx.send(embed=embed)
 
     @handle_errors
     async def show_role_members(self, ctx, role: discord.Role) -> None:
         """!role <name> command implementation."""
-        record_command_usage(self.state.analytics, "!role")
-        record_command_usage_by_user(self.state.analytics, ctx.author.id, "!role")
+        record_command_usage_full(self.state.analytics, ctx.author.id, "!role")
         
-        if not role.members:
+        role_members = role.members
+        if not role_members:
             await ctx.send(f"No members found in the **{role.name}** role.")
             return
         
-        sorted_members = sorted(role.members, key=lambda m: m.name.lower())
+        sorted_members = sorted(role_members, key=lambda m: m.name.casefold())
         
         def process_member(member):
             return f"• {member.display_name} ({member.name})"
         
         embeds = create_message_chunks(
             entries=sorted_members,
-            title=f"Members in Role: {role.name} (Total: {len(role.members)})",
+            title=f"Members in Role: {role.name} (Total: {len(role_members)})",
             process_entry=process_member,
             as_embed=True,
             embed_color=role.color or discord.Color.blue(),
@@ -1858,10 +2543,7 @@ class BotHelper:
     @handle_errors
     async def show_admin_list(self, ctx) -> None:
         """!admin command implementation."""
-        from tools import build_embed  # Local import to avoid circular dependency
-        
-        record_command_usage(self.state.analytics, "!admin")
-        record_command_usage_by_user(self.state.analytics, ctx.author.id, "!admin")
+        record_command_usage_full(self.state.analytics, ctx.author.id, "!admin")
         
         guild = ctx.guild
         if not guild:
@@ -1869,25 +2551,34 @@ class BotHelper:
 
         # Get Owners (from config.py)
         owners_list = []
+        missing_ids = []
         for user_id in self.bot_config.ALLOWED_USERS:
             member = guild.get_member(user_id)
             if member:
                 owners_list.append(f"{member.name} ({member.display_name})")
             else:
-                try:
-                    user = await self.bot.fetch_user(user_id)
+                missing_ids.append(user_id)
+
+        # Fetch owners who aren't in the server concurrently
+        if missing_ids:
+            fetched = await asyncio.gather(
+                *(self.bot.fetch_user(uid) for uid in missing_ids),
+                return_exceptions=True,
+            )
+            for user_id, user in zip(missing_ids, fetched):
+                if isinstance(user, BaseException):
+                    owners_list.append(f"Unknown User (ID: {user_id})")
+                else:
                     owners_list.append(
                         f"{user.name} (Not in server, ID: {user_id})"
                     )
-                except discord.NotFound:
-                    owners_list.append(f"Unknown User (ID: {user_id})")
         
         # Get Admins (from roles in config.py)
         admins_set = set()
         admin_roles = [
             role
             for role in guild.roles
-            if role.name in self.bot_config.ADMIN_ROLE_NAME
+            if role.name in self.admin_role_names
         ]
         for role in admin_roles:
             for member in role.members:
@@ -1906,134 +2597,63 @@ class BotHelper:
     @handle_errors
     async def show_commands_list(self, ctx) -> None:
         """!commands command implementation."""
-        from tools import build_embed
-        
-        record_command_usage(self.state.analytics, "!commands")
-        record_command_usage_by_user(self.state.analytics, ctx.author.id, "!commands")
-        
-        user_commands = (
-            "`!skip` - Skips the current Omegle user.\n"
-            "`!refresh` - Refreshes the Omegle page.\n"
-            "`!info` - Shows server info/rules.\n"
-            "`!rules` - Shows the server rules.\n"
-            "`!timer <1-60>` - Starts a timer (minutes).\n"
-            "`!timerstop` - Stops current user timer.\n"
-            "`!mskip` - Skips the current song.\n"
-            "`!mpp` - Toggles music play and pause.\n"
-            "`!vol 1-100` - Sets music volume (0-100).\n"
-            "`!m songname` - Searches for songs/URLs.\n"
-            "`!mclear` - Clears all songs from the search queue.\n"
-            "`!mshuffle` - Cycles music mode (Shuffle -> Alphabetical -> Loop).\n"
-            "`!np` - Shows currently playing song.\n"
-            "`!q` - Displays the interactive song queue.\n"
-            "`!playlist <save|load|list|delete> [name]` - Manages playlists."
-        )
+        record_command_usage_full(self.state.analytics, ctx.author.id, "!commands")
         
-        admin_commands = (
-            "`!report` - Reports the current user on Omegle.\n"
-            "`!moff` - Disables all music features and disconnects the bot.\n"
-            "`!mon` - Enables all music features and connects the bot.\n"
-            "`!rtimeouts` - Removes all active timeouts from users.\n"
-            "`!display <user>` - Shows a detailed profile for a user.\n"
-            "`!role <@role>` - Lists all members in a specific role.\n"
-            "`!move <@user>` - Moves a user from Streaming to Punishment VC.\n"
-            "`!commands` - Shows this list of all commands."
-        )
-        
-        allowed_commands = (
-            "`!purge <count>` - Purges a specified number of messages.\n"
-            "`!help` - Sends the interactive help menu with buttons.\n"
-            "`!music` - Sends the interactive music control menu.\n"
-            "`!times` - Shows top VC users by time.\n"
-            "`!timeouts` - Shows currently timed-out users.\n"
-            "`!bans` - Shows currently banned users.\n"
-            "`!hush` - Server-mutes all non-admin users in the Streaming VC.\n"
-            "`!rhush` / `!removehush` - Removes server-mutes from all users.\n"
-            "`!secret` - Server-mutes and deafens all non-admin users.\n"
-            "`!rsecret` / `!removesecret` - Removes mute/deafen from all users.\n"
-            "`!modoff` / `!modon` - Toggles automated VC moderation.\n"
-            "`!disablenotifications` / `!enablenotifications` - Toggles notifications.\n"
-            "`!ban <user>` - Bans user(s) with a reason prompt.\n"
-            "`!unban <user_id>` - Unbans a user by ID.\n"
-            "`!unbanall` - Unbans every user from the server.\n"
-            "`!disable <user>` - Disables a user from using commands.\n"
-            "`!enable <user>` - Re-enables a disabled user.\n"
-            "`!top` - Lists the top 10 oldest server/Discord accounts.\n"
-            "`!roles` - Lists all server roles and their members.\n"
-            "`!admin` / `!owner` - Lists configured bot owners and admins.\n"
-            "`!whois` - Shows a 24-hour report of server activity.\n"
-            "`!stats` - Shows a detailed analytics report.\n"
-            "`!join` - DMs a join invite to all users with an admin role.\n"
-            "`!clearstats` - Clears all statistical data.\n"
-            "`!clearwhois` - Clears all historical event data.\n"
-            "`!vote <roles or users>` - Starts a Smash or Pass vote.\n"
-            "`!endvote` - Stops the current Smash or Pass voting system.\n"
-            "`!shutdown` - Safely shuts down the bot."
-        )
-        
-        await ctx.send(
-            embed=build_embed(
-                "👤 User Commands (Camera On)",
-                user_commands,
-                discord.Color.blue(),
-            )
-        )
-        await ctx.send(
-            embed=build_embed(
-                "🛡️ Admin Commands (Camera On)",
-                admin_commands,
-                discord.Color.red(),
-            )
-        )
-        await ctx.send(
-            embed=build_embed(
-                "👑 Owner Commands (No Requirements)",
-                allowed_commands,
-                discord.Color.gold(),
-            )
-        )
+        # All three fit well under the 6000-char message cap; one send keeps
+        # their order without three round trips
+        await ctx.send(embeds=[embed.copy() for embed in _command_list_embeds()])
 
     @handle_errors
     async def show_whois(self, ctx) -> None:
         """!whois command implementation."""
-        record_command_usage(self.state.analytics, "!whois")
-        record_command_usage_by_user(self.state.analytics, ctx.author.id, "!whois")
+        record_command_usage_full(self.state.analytics, ctx.author.id, "!whois")
         
         now = datetime.now(timezone.utc)
         reports = {}
         has_data = False
 
-        # --- Gather Data (Locked) ---
-        async with self.state.moderation_lock:
-            time_filter = now - timedelta(hours=24)
-            
-            # --- ADD THIS LINE BELOW ---
-            timeout_data = self.state.active_timeouts.copy() 
-            # ---------------------------
+        # --- Snapshot State (Locked) ---
+        # Only grab references under the lock; filtering happens below so
+        # ban/remove handlers waiting on the lock aren't held up.
+        async with self.state.moderation_lock.reader_lock:
+            timeout_data = self.state.active_timeouts.copy()
+            snapshots = {
+                name: getattr(self.state, name) for name in HISTORY_TIME_INDEX
+            }
 
-            timed_out_members = [
-                member for member in ctx.guild.members if member.is_timed_out()
-            ]
-            untimeout_list = [
-                e
-                for e in self.state.recent_untimeouts
-                if e[3] >= time_filter
-                and (len(e) > 5 and e[5] and (e[5] != "System"))
-            ]
-            kick_list = [e for e in self.state.recent_kicks if e[3] >= time_filter]
-            ban_list = [e for e in self.state.recent_bans if e[3] >= time_filter]
-            unban_list = [e for e in self.state.recent_unbans if e[3] >= time_filter]
-            join_list = [e for e in self.state.recent_joins if e[3] >= time_filter]
-            leave_list = [e for e in self.state.recent_leaves if e[3] >= time_filter]
-            role_change_list = [
-                e for e in self.state.recent_role_changes if e[4] >= time_filter
-            ]
+        # --- Filter to the last 24h ---
+        # No awaits below, so the deques can't change underneath us
+        time_filter = now - timedelta(hours=24)
+        timed_out_members = self._timed_out_members(ctx.guild)
+        # Keep only the most recent entries per category before formatting;
+        # untimeouts are filtered first, so they're capped afterwards
+        cap = self.bot_config.REPORT_MAX_ENTRIES_PER_CATEGORY
+        recent = {
+            name: _entries_since(
+                entries,
+                HISTORY_TIME_INDEX[name],
+                time_filter,
+                None if name == "recent_untimeouts" else cap,
+            )
+            for name, entries in snapshots.items()
+        }
+        untimeout_list = [
+            e
+            for e in recent["recent_untimeouts"]
+            if len(e) > 5 and e[5] and (e[5] != "System")
+        ][-cap:]
+        kick_list = recent["recent_kicks"]
+        ban_list = recent["recent_bans"]
+        unban_list = recent["recent_unbans"]
+        join_list = recent["recent_joins"]
+        leave_list = recent["recent_leaves"]
+        role_change_list = recent["recent_role_changes"]
 
         # --- Build User Cache ---
         # Collect all unique user IDs from the gathered data
         user_ids_to_map = {
             entry[0]
-            for data_list in [
+            for entry in chain(
                 untimeout_list,
                 kick_list,
                 ban_list,
@@ -2041,36 +2661,14 @@ class BotHelper:
                 join_list,
                 leave_list,
                 role_change_list,
-            ]
-            for entry in data_list
+            )
         }
-        user_map = {}
-        if user_ids_to_map:
-            ids_to_fetch = set()
-            for user_id in user_ids_to_map:
-                if (member := ctx.guild.get_member(user_id)):
-                    user_map[user_id] = member  # Get from server cache if present
-                else:
-                    ids_to_fetch.add(user_id)  # Otherwise, mark for fetching
-            
-            # Fetch users who are not in the server cache (e.g., left/banned)
-            if ids_to_fetch:
-                async def fetch_user(uid):
-                    await asyncio.sleep(0.1)  # Rate limit fetches
-                    try:
-                        return (uid, await self.bot.fetch_user(uid))
-                    except discord.NotFound:
-                        return (uid, None)
-                    except Exception as e:
-                        logger.warning(
-                            f"Could not fetch user {uid} for whois report: {e}"
-                        )
-                        return (uid, None)
-                
-                fetch_tasks = [fetch_user(uid) for uid in ids_to_fetch]
-                results = await asyncio.gather(*fetch_tasks)
-                for uid, user_obj in results:
-                    user_map[uid] = user_obj
+        # Cache first, then one batched member query, then fetch_user for the rest
+        user_map = (
+            await self._resolve_users(ctx.guild, list(user_ids_to_map))
+            if user_ids_to_map
+            else {}
+        )
 
         # --- Helper Functions for Processing ---
         def get_clean_mention(identifier):
@@ -2117,68 +2715,75 @@ class BotHelper:
 
         if untimeout_list:
             has_data = True
-            def process_untimeout(entry):
-                uid, _, _, ts, _, mod_name, mod_id = entry
-                mod_mention = get_clean_mention(mod_id or mod_name)
-                return f"• <@{uid}> - by {mod_mention} <t:{int(ts.timestamp())}:R>"
+            # Simple one-line categories are formatted in a single comprehension
+            # and handed to the chunker pre-built
+            untimeout_lines = [
+                _WHOIS_UNTIMEOUT_TMPL.format(
+                    uid=uid, mod=get_clean_mention(mod_id or mod_name), ts=ts_unix
+                )
+                for uid, _, _, _, _, mod_name, mod_id, ts_unix in untimeout_list
+            ]
 
             reports["🔓 Recent Untimeouts"] = create_message_chunks(
-                untimeout_list,
+                untimeout_lines,
                 "🔓 Recent Untimeouts (24h)",
-                process_untimeout,
+                lambda line: line,
                 as_embed=True,
                 embed_color=discord.Color.from_rgb(173, 216, 230),
             )
 
         if kick_list:
             has_data = True
-            def process_kick(entry):
-                uid, name, dname, ts, reason, mod, _ = entry
-                user_info = get_user_display_info(uid, name, dname)
-                line = f"• {user_info} - by {mod}"
-                if reason and reason != "No reason provided":
-                    line += f" for *{reason}*"
-                line += f" <t:{int(ts.timestamp())}:R>"
-                return line
+            kick_lines = [
+                _WHOIS_KICK_TMPL.format(
+                    user=get_user_display_info(uid, name, dname),
+                    mod=mod,
+                    reason=_reason_suffix(reason, "for"),
+                    ts=ts_unix,
+                )
+                for uid, name, dname, _, reason, mod, _, ts_unix in kick_list
+            ]
 
             reports["👢 Recent Kicks"] = create_message_chunks(
-                kick_list,
+                kick_lines,
                 "👢 Recent Kicks (24h)",
-                process_kick,
+                lambda line: line,
                 as_embed=True,
                 embed_color=discord.Color.orange(),
             )
 
         if ban_list:
             has_data = True
-            def process_ban(entry):
-                uid, name, dname, ts, reason = entry
-                user_info = get_user_display_info(uid, name, dname)
-                line = f"• {user_info}"
-                if reason and reason != "No reason provided":
-                    line += f" - for *{reason}*"
-                line += f" <t:{int(ts.timestamp())}:R>"
-                return line
+            ban_lines = [
+                _WHOIS_BAN_TMPL.format(
+                    user=get_user_display_info(uid, name, dname),
+                    reason=_reason_suffix(reason, "- for"),
+                    ts=ts_unix,
+                )
+                for uid, name, dname, _, reason, ts_unix in ban_list
+            ]
 
             reports["🔨 Recent Bans"] = create_message_chunks(
-                ban_list,
+                ban_lines,
                 "🔨 Recent Bans (24h)",
-                process_ban,
+                lambda line: line,
                 as_embed=True,
                 embed_color=discord.Color.dark_red(),
             )
 
         if unban_list:
             has_data = True
-            def process_unban(entry):
-                uid, name, dname, ts, mod = entry
-                user_info = get_user_display_info(uid, name, dname)
-                return f"• {user_info} - by {mod} <t:{int(ts.timestamp())}:R>"
+            unban_lines = [
+                _WHOIS_UNBAN_TMPL.format(
+                    user=get_user_display_info(uid, name, dname), mod=mod, ts=ts_unix
+                )
+                for uid, name, dname, _, mod, ts_unix in unban_list
+            ]
 
             reports["🔓 Recent Unbans"] = create_message_chunks(
-                unban_list,
+                unban_lines,
                 "🔓 Recent Unbans (24h)",
-                process_unban,
+                lambda line: line,
                 as_embed=True,
                 embed_color=discord.Color.dark_green(),
             )
@@ -2186,9 +2791,9 @@ class BotHelper:
         if role_change_list:
             has_data = True
             def process_role_change(entry):
-                uid, name, gained, lost, ts = entry
+                uid, name, gained, lost, _, ts_unix = entry
                 user_info = get_user_display_info(uid, name)
-                parts = [f"• {user_info} <t:{int(ts.timestamp())}:R>"]
+                parts = [f"• {user_info} <t:{ts_unix}:R>"]
                 if gained:
                     parts.append(f"  - **Gained**: {', '.join(gained)}")
                 if lost:
@@ -2205,30 +2810,34 @@ class BotHelper:
 
         if join_list:
             has_data = True
-            def process_join(entry):
-                uid, name, dname, ts = entry
-                user_info = get_user_display_info(uid, name, dname)
-                return f"• {user_info} <t:{int(ts.timestamp())}:R>"
+            join_lines = [
+                _WHOIS_EVENT_TMPL.format(
+                    user=get_user_display_info(uid, name, dname), ts=ts_unix
+                )
+                for uid, name, dname, _, ts_unix in join_list
+            ]
 
             reports["🎉 Recent Joins"] = create_message_chunks(
-                join_list,
+                join_lines,
                 "🎉 Recent Joins (24h)",
-                process_join,
+                lambda line: line,
                 as_embed=True,
                 embed_color=discord.Color.green(),
             )
 
         if leave_list:
             has_data = True
-            def process_leave(entry):
-                uid, name, dname, ts, _ = entry
-                user_info = get_user_display_info(uid, name, dname)
-                return f"• {user_info} <t:{int(ts.timestamp())}:R>"
+            leave_lines = [
+                _WHOIS_EVENT_TMPL.format(
+                    user=get_user_display_info(uid, name, dname), ts=ts_unix
+                )
+                for uid, name, dname, _, _, ts_unix in leave_list
+            ]
 
             reports["🚪 Recent Leaves"] = create_message_chunks(
-                leave_list,
+                leave_lines,
                 "🚪 Recent Leaves (24h)",
-                process_leave,
+                lambda line: line,
                 as_embed=True,
                 embed_color=discord.Color.red(),
             )
@@ -2249,82 +2858,91 @@ class BotHelper:
             "🚪 Recent Leaves",
         ]
         
-        for report_type in report_order:
-            if report_type in reports:
-                for chunk in reports[report_type]:
-                    if isinstance(chunk, discord.Embed):
-                        await ctx.send(embed=chunk)
-                    else:
-                        await ctx.send(chunk)
-                    await asyncio.sleep(0.5)  # Avoid rate limits
+        await self._send_chunks(
+            ctx,
+            [
+                chunk
+                for report_type in report_order
+                if report_type in reports
+                for chunk in reports[report_type]
+            ],
+        )
 
     @handle_errors
     async def remove_timeouts(self, ctx) -> None:
         """!rtimeouts command implementation."""
-        record_command_usage(self.state.analytics, "!rtimeouts")
-        record_command_usage_by_user(self.state.analytics, ctx.author.id, "!rtimeouts")
+        record_command_usage_full(self.state.analytics, ctx.author.id, "!rtimeouts")
         
-        timed_out_members = [m for m in ctx.guild.members if m.is_timed_out()]
+        timed_out_members = self._timed_out_members(ctx.guild)
         if not timed_out_members:
             await ctx.send("No users are currently timed out.")
             return
 
         # --- Confirmation Step ---
-        confirm_msg = await ctx.send(
+        confirm_view = ConfirmView(ctx.author.id)
+        await ctx.send(
             f"⚠️ **WARNING:** This will remove timeouts from {len(timed_out_members)} members!\n"
-            "React with ✅ to confirm or ❌ to cancel within 30 seconds."
+            "Press Confirm or Cancel within 30 seconds.",
+            view=confirm_view,
         )
-        for emoji in ["✅", "❌"]:
-            await confirm_msg.add_reaction(emoji)
-
-        def check(reaction, user):
-            return (
-                user == ctx.author
-                and str(reaction.emoji) in ["✅", "❌"]
-                and (reaction.message.id == confirm_msg.id)
-            )
+        await confirm_view.wait()
 
-        try:
-            reaction, _ = await self.bot.wait_for(
-                "reaction_add", timeout=30.0, check=check
-            )
-            if str(reaction.emoji) == "❌":
-                await ctx.send("Command cancelled.")
-                return
-        except asyncio.TimeoutError:
+        if confirm_view.result is None:
             await ctx.send("⌛ Command timed out. No changes were made.")
             return
+        if not confirm_view.result:
+            await ctx.send("Command cancelled.")
+            return
         # --- End Confirmation ---
 
-        removed, failed = ([], [])
-        for member in timed_out_members:
-            try:
-                await member.timeout(
-                    None, reason=f"Timeout removed by {ctx.author.name} ({ctx.author.id})"
-                )
+        removed, failed, succeeded = ([], [], [])
+        untimeout_sem = asyncio.Semaphore(5)  # Cap concurrent member PATCHes
+        reason = f"Timeout removed by {ctx.author.name} ({ctx.author.id})"
+
+        async def untimeout(member):
+            async with untimeout_sem:
+                try:
+                    await member.timeout(None, reason=reason)
+                except discord.Forbidden:
+                    failed.append(f"{member.name} (Missing Permissions)")
+                    return
+                except discord.HTTPException as e:
+                    failed.append(f"{member.name} (Error: {e})")
+                    return
+            succeeded.append(member)
+
+        await asyncio.gather(*(untimeout(member) for member in timed_out_members))
+
+        # Log to state for !whois, in one critical section for the whole batch
+        async with self.state.moderation_lock:
+            now = datetime.now(timezone.utc)
+            now_unix = int(now.timestamp())
+            for member in succeeded:
                 removed.append(member.name)
-                # Log to state for !whois
-                async with self.state.moderation_lock:
-                    if member.id in self.state.active_timeouts:
-                        self.state.recent_untimeouts.append(
-                            (
-                                member.id,
-                                member.name,
-                                member.display_name,
-                                datetime.now(timezone.utc),
-                                f"Manually removed by {ctx.author.name}",
-                                ctx.author.name,
-                                ctx.author.id,
-                            )
+                if member.id in self.state.active_timeouts:
+                    self.state.recent_untimeouts.append(
+                        (
+                            member.id,
+                            member.name,
+                            member.display_name,
+                            now,
+                            f"Manually removed by {ctx.author.name}",
+                            ctx.author.name,
+                            ctx.author.id,
+                            now_unix,
                         )
-                        del self.state.active_timeouts[member.id]
-                logger.info(
-                    f"Removed timeout from {member.name} by {ctx.author.name}"
-                )
-            except discord.Forbidden:
-                failed.append(f"{member.name} (Missing Permissions)")
-            except discord.HTTPException as e:
-                failed.append(f"{member.name} (Error: {e})")
+                    )
+                    del self.state.active_timeouts[member.id]
+                    self.state.moderation_version += 1
+
+        if removed:
+            # One log record for the whole batch; loguru formats lazily from args
+            logger.info(
+                "Removed timeouts from {} members by {}: {}",
+                len(removed),
+                ctx.author.name,
+                ", ".join(removed),
+            )
 
         # Send summary
         result_msg = []
@@ -2337,34 +2955,48 @@ class BotHelper:
                 f"\n**❌ Failed to remove timeouts from:**\n- " + "\n".join(failed)
             )
         if result_msg:
-            await ctx.send("\n".join(result_msg))
+            await self._rate_limited_send(ctx, "\n".join(result_msg))
         
         # Announce in chat
-        if (chat_channel := ctx.guild.get_channel(self.bot_config.CHAT_CHANNEL_ID)):
-            await chat_channel.send(
+        if (chat_channel := self._get_chat_channel()):
+            await self._rate_limited_send(
+                chat_channel,
                 f"⏰ **Mass Timeout Removal**\nExecuted by {ctx.author.mention}\n"
                 f"Removed: {len(removed)} | Failed: {len(failed)}"
             )
         
-        asyncio.create_task(self.update_timeouts_report_menu()) # <-- ADDED
+        self._spawn(self.update_timeouts_report_menu()) # <-- ADDED
 
     @handle_errors
     async def show_rules(self, ctx) -> None:
         """!rules command implementation."""
         if not getattr(ctx, "from_button", False):
-            record_command_usage(self.state.analytics, "!rules")
-            record_command_usage_by_user(self.state.analytics, ctx.author.id, "!rules")
+            record_command_usage_full(self.state.analytics, ctx.author.id, "!rules")
         
         await ctx.send("📋 **Server Rules:**\n" + self.bot_config.RULES_MESSAGE)
 
-    async def create_timeouts_report_embed(self) -> Optional[discord.Embed]:
+    async def create_timeouts_report_embed(
+        self, force: bool = False
+    ) -> Optional[discord.Embed]:
         """
         Builds the embed for the persistent 'Moderation Status' menu.
+        Reuses the last build if moderation state hasn't changed within the TTL,
+        unless force is set.
         """
         guild = self.bot.get_guild(self.bot_config.GUILD_ID)
         if not guild:
             return None
 
+        version = self.state.moderation_version
+        cache = self._timeouts_embed_cache
+        if (
+            not force
+            and cache
+            and cache[0] == version
+            and time.monotonic() - cache[1] < self.TIMEOUTS_EMBED_TTL_SECONDS
+        ):
+            return cache[2].copy()
+
         def get_clean_mention(identifier):
             if identifier is None:
                 return "Unknown"
@@ -2380,19 +3012,17 @@ class BotHelper:
         has_data = False # <-- To track if any fields are added
 
         # --- Field 1: Active Timeouts ---
-        timed_out_members = [
-            member for member in guild.members if member.is_timed_out()
-        ]
+        timed_out_members = self._timed_out_members(guild)
         
         # --- Only run if there are timed out members ---
         if timed_out_members:
             has_data = True # Mark that we have data
-            timeout_data = {}
-            async with self.state.moderation_lock:
-                for member in timed_out_members:
-                    timeout_data[member.id] = self.state.active_timeouts.get(
-                        member.id, {}
-                    )
+            # Plain dict reads with no await in between can't interleave with a writer
+            active_timeouts = self.state.active_timeouts
+            timeout_data = {
+                member.id: active_timeouts.get(member.id, {})
+                for member in timed_out_members
+            }
             
             # This is the function we fixed
             def process_timeout(member):
@@ -2418,25 +3048,23 @@ class BotHelper:
             )
         
         # --- Field 2: Command Disabled Users ---
-        async with self.state.moderation_lock:
+        async with self.state.moderation_lock.reader_lock:
             disabled_user_ids = list(self.state.omegle_disabled_users)
         
         # --- Only run if there are disabled users ---
         if disabled_user_ids:
             has_data = True # Mark that we have data
             
-            async def get_disabled_user_line(user_id):
-                try:
-                    user = await self.bot.fetch_user(user_id)
+            user_map = await self._resolve_users(guild, disabled_user_ids)
+
+            def get_disabled_user_line(user_id):
+                if (user := user_map.get(user_id)):
                     return f"• {user.mention} (`{user.name}`)"
-                except discord.NotFound:
-                    return f"• Unknown User (ID: `{user_id}`)"
-                except Exception:
-                    return f"• Error fetching User ID `{user_id}`"
+                return f"• Unknown User (ID: `{user_id}`)"
 
-            disabled_user_lines = await asyncio.gather(
-                *(get_disabled_user_line(uid) for uid in disabled_user_ids)
-            )
+            disabled_user_lines = [
+                get_disabled_user_line(uid) for uid in disabled_user_ids
+            ]
 
             embed.add_field(
                 name=f"🚫 Command Disabled",
@@ -2445,7 +3073,7 @@ class BotHelper:
             )
 
         # --- Field 3: Recent Manual Untimeouts ---
-        async with self.state.moderation_lock:
+        async with self.state.moderation_lock.reader_lock:
             untimeout_entries = [
                 e
                 for e in self.state.recent_untimeouts
@@ -2456,17 +3084,16 @@ class BotHelper:
         if untimeout_entries:
             has_data = True # Mark that we have data
             untimeout_lines = []
-            processed_users = set()
-            unique_untimeout_entries = []
-            # Get only the most recent untimeout per user
-            for entry in reversed(untimeout_entries):
-                if entry[0] not in processed_users:
-                    unique_untimeout_entries.append(entry)
-                    processed_users.add(entry[0])
+            # Get only the most recent untimeout per user. Re-inserting moves a
+            # user to the end, so the dict stays ordered by latest untimeout.
+            latest_by_user = {}
+            for entry in untimeout_entries:
+                latest_by_user.pop(entry[0], None)
+                latest_by_user[entry[0]] = entry
             
-            for entry in reversed(unique_untimeout_entries[:10]): # Show last 10
+            for entry in list(latest_by_user.values())[-10:]: # Show last 10
                 user_id = entry[0]
-                ts = entry[3]
+                ts_unix = entry[7]
                 mod_name = entry[5]
                 mod_id = entry[6] if len(entry) > 6 else None
                 mod_mention = (
@@ -2475,7 +3102,7 @@ class BotHelper:
                 line = f"• <@{user_id}>"
                 if mod_mention and mod_mention != "Unknown":
                     line += f" by {mod_mention}"
-                line += f" <t:{int(ts.timestamp())}:R>"
+                line += f" <t:{ts_unix}:R>"
                 untimeout_lines.append(line)
 
             if untimeout_lines:
@@ -2489,6 +3116,7 @@ class BotHelper:
         if not has_data:
             embed.description = "All moderation systems are clear."
 
+        self._timeouts_embed_cache = (version, time.monotonic(), embed.copy())
         return embed
 
     @handle_errors
@@ -2513,11 +3141,10 @@ class BotHelper:
     @handle_errors
     async def show_timeouts(self, ctx) -> None:
         """!timeouts command implementation."""
-        record_command_usage(self.state.analytics, "!timeouts")
-        record_command_usage_by_user(self.state.analytics, ctx.author.id, "!timeouts")
+        record_command_usage_full(self.state.analytics, ctx.author.id, "!timeouts")
         
         # This command now just generates the embed and sends it as a one-off message.
-        embed = await self.create_timeouts_report_embed()
+        embed = await self.create_timeouts_report_embed(force=True)
         if embed:
             # Change title for the one-off command
             embed.title = "🛡️ Current Moderation Status 🛡️"
@@ -2532,13 +3159,11 @@ class BotHelper:
         if not guild:
             return None
 
-        async def get_user_display_info(user_id, data):
-            """Helper to get a user's name and highest role."""
+        def get_user_display_info(user_id, data):
+            """Helper to get a user's name and highest role (cache-only)."""
             if (member := guild.get_member(user_id)):
-                roles = [role for role in member.roles if role.name != "@everyone"]
-                highest_role = (
-                    max(roles, key=lambda r: r.position) if roles else None
-                )
+                top_role = member.top_role
+                highest_role = top_role if top_role.id != guild.id else None
                 role_display = f"**[{highest_role.name}]**" if highest_role else ""
                 return f"{member.mention} {role_display}"
             username = data.get("username", "Unknown User")
@@ -2549,56 +3174,56 @@ class BotHelper:
 
         async def get_vc_time_data():
             """Calculates total time, merging saved data and active sessions."""
+            # Only per-user totals are built under the lock; full records are
+            # looked up afterwards for the handful of users that make the top 10.
             async with self.state.vc_lock:
                 current_time = time.time()
-                # Copy saved data, excluding excluded users
-                combined_data = {
-                    uid: d.copy()
-                    for uid, d in self.state.vc_time_data.items()
+                totals = {
+                    uid: total
+                    for uid, total in self.state.vc_total_time.items()
                     if not is_excluded(uid)
                 }
-                total_time_all_users = sum(
-                    (d.get("total_time", 0) for d in combined_data.values())
-                )
+                total_time_all_users = sum(totals.values())
 
                 # Add time from currently active sessions
                 for user_id, start_time in self.state.active_vc_sessions.items():
                     if is_excluded(user_id):
                         continue
                     active_duration = current_time - start_time
-                    if user_id in combined_data:
-                        combined_data[user_id]["total_time"] += active_duration
-                    else:
-                        member = guild.get_member(user_id)
-                        combined_data[user_id] = {
-                            "total_time": active_duration,
-                            "username": member.name if member else "Unknown",
-                            "display_name": member.display_name
-                            if member
-                            else "Unknown",
-                        }
+                    totals[user_id] = totals.get(user_id, 0) + active_duration
                     total_time_all_users += active_duration
             
-            # Sort and get top 10
-            sorted_users = sorted(
-                combined_data.items(),
-                key=lambda item: item[1].get("total_time", 0),
-                reverse=True,
-            )[:10]
+            # Get top 10
+            sorted_users = []
+            for user_id, total in heapq.nlargest(10, totals.items(), key=itemgetter(1)):
+                if user_id in self.state.vc_username:
+                    username = self.state.vc_username[user_id]
+                    display_name = self.state.vc_display_name.get(user_id, "Unknown")
+                else:
+                    member = guild.get_member(user_id)
+                    username = member.name if member else "Unknown"
+                    display_name = member.display_name if member else "Unknown"
+                sorted_users.append(
+                    (
+                        user_id,
+                        {
+                            "total_time": total,
+                            "username": username,
+                            "display_name": display_name,
+                        },
+                    )
+                )
             return (total_time_all_users, sorted_users)
 
         # Get total tracking duration
         total_tracking_seconds = 0
         async with self.state.vc_lock:
-            all_start_times = [
-                s["start"]
-                for d in self.state.vc_time_data.values()
-                for s in d.get("sessions", [])
-                if "start" in s
-            ]
-            all_start_times.extend(self.state.active_vc_sessions.values())
-            if all_start_times:
-                total_tracking_seconds = time.time() - min(all_start_times)
+            earliest_start = min(
+                self.state.first_session_start or math.inf,
+                min(self.state.active_vc_sessions.values(), default=math.inf),
+            )
+            if earliest_start != math.inf:
+                total_tracking_seconds = time.time() - earliest_start
 
         total_time_all_users, top_vc_users = await get_vc_time_data()
 
@@ -2608,38 +3233,33 @@ class BotHelper:
             average_user_count = round(total_time_all_users / total_tracking_seconds)
 
         # --- Build Embed ---
-        description_lines = []
-        tracking_time_str = format_duration(total_tracking_seconds)
-        description_lines.append(f"⏳ **Tracking Started:** {tracking_time_str} ago")
-        description_lines.append("")
-
-        if top_vc_users:
-            for i, (uid, data) in enumerate(top_vc_users):
-                total_s = data.get("total_time", 0)
-                time_str = format_duration(total_s)
-                display_info = await get_user_display_info(uid, data)
-                description_lines.append(
-                    f"**{i + 1}.** {display_info}: **{time_str}**"
-                )
-        else:
-            description_lines.append("No VC time data available yet.")
-
-        description_lines.append("")
-
+        # Member lookups are cache-only, so the rows are built in one pass
+        # and the description is joined once at the end
+        rows = [
+            f"**{i}.** {get_user_display_info(uid, data)}: "
+            f"**{format_duration(data.get('total_time', 0))}**"
+            for i, (uid, data) in enumerate(top_vc_users, 1)
+        ] or ["No VC time data available yet."]
+
+        footer = []
         if average_user_count > 0:
-            description_lines.append(
-                f"👥 **Average User Count:** {average_user_count}"
-            )
-
+            footer.append(f"👥 **Average User Count:** {average_user_count}")
         total_hours = math.ceil(total_time_all_users / 3600)
-        total_time_str = f"{total_hours} hours"
-        description_lines.append(
-            f"⏱ **Total VC Time (All Users):** {total_time_str}"
+        footer.append(f"⏱ **Total VC Time (All Users):** {total_hours} hours")
+
+        description = "\n".join(
+            [
+                f"⏳ **Tracking Started:** {format_duration(total_tracking_seconds)} ago",
+                "",
+                *rows,
+                "",
+                *footer,
+            ]
         )
 
         embed = discord.Embed(
             title="🏆 Top 10 VC Members 🏆",
-            description="\n".join(description_lines),
+            description=description,
             color=discord.Color.gold(),
         )
         return embed
@@ -2655,10 +3275,7 @@ class BotHelper:
             else destination
         )
         if isinstance(destination, commands.Context):
-            record_command_usage(self.state.analytics, "!times")
-            record_command_usage_by_user(
-                self.state.analytics, destination.author.id, "!times"
-            )
+            record_command_usage_full(self.state.analytics, destination.author.id, "!times")
         
         embed = await self.create_times_report_embed()
         if embed:
@@ -2673,10 +3290,7 @@ class BotHelper:
         if isinstance(destination, commands.Context):
             ctx = destination
             channel = ctx.channel
-            record_command_usage(self.state.analytics, "!stats")
-            record_command_usage_by_user(
-                self.state.analytics, ctx.author.id, "!stats"
-            )
+            record_command_usage_full(self.state.analytics, ctx.author.id, "!stats")
         else:
             ctx = None
             channel = destination
@@ -2685,7 +3299,7 @@ class BotHelper:
 
         # --- Report 1: VC Times ---
         await self.show_times_report(channel)
-        await channel.send("\n" + "─" * 50 + "\n")
+        await self._rate_limited_send(channel, "\n" + "─" * 50 + "\n")
 
         # --- Helper Functions ---
         async def get_user_display_info(user_id):
@@ -2693,12 +3307,8 @@ class BotHelper:
             try:
                 user = self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
                 if (member := guild.get_member(user_id)):
-                    roles = [
-                        role for role in member.roles if role.name != "@everyone"
-                    ]
-                    highest_role = (
-                        max(roles, key=lambda r: r.position) if roles else None
-                    )
+                    top_role = member.top_role
+                    highest_role = top_role if top_role.id != guild.id else None
                     role_display = (
                         f"**[{highest_role.name}]**" if highest_role else ""
                     )
@@ -2707,17 +3317,14 @@ class BotHelper:
             except Exception:
                 return f"<@{user_id}> (Unknown User)"
 
-        async def get_user_plain_name(user_id):
+        async def get_user_plain_name(user_id, user_map):
             """Gets user's `Name#discriminator`."""
-            try:
-                user = self.bot.get_user(user_id) or await self.bot.fetch_user(user_id)
+            if (user := user_map.get(user_id)):
                 return f"`{user.name}#{user.discriminator}`"
-            except Exception:
-                # Fallback to name from VC data if user left
-                async with self.state.vc_lock:
-                    vc_data = self.state.vc_time_data.get(user_id, {})
-                    username = vc_data.get("username", f"ID: {user_id}")
-                return f"`{username}` (Left/Not Found)"
+            # Fallback to name from VC data if user left
+            async with self.state.vc_lock:
+                username = self.state.vc_username.get(user_id, f"ID: {user_id}")
+            return f"`{username}` (Left/Not Found)"
 
         def is_excluded(user_id):
             return user_id in self.bot_config.STATS_EXCLUDED_USERS
@@ -2740,7 +3347,7 @@ class BotHelper:
                 as_embed=True,
                 embed_color=discord.Color.blue(),
             ):
-                await channel.send(embed=chunk)
+                await self._rate_limited_send(channel, embed=chunk)
 
         # --- Report 3: Command Usage (By User) ---
         async with self.state.analytics_lock:
@@ -2748,14 +3355,16 @@ class BotHelper:
         
         if usage_by_user_data:
             has_any_stats_data = True
-            filtered_users = [
-                (uid, cmds)
+            # Total each user's usage once up front rather than inside the key
+            scored_users = [
+                (sum(cmds.values()), uid, cmds)
                 for uid, cmds in usage_by_user_data.items()
                 if not is_excluded(uid)
             ]
-            sorted_users = sorted(
-                filtered_users, key=lambda item: sum(item[1].values()), reverse=True
-            )[:10]
+            sorted_users = [
+                (uid, cmds)
+                for _, uid, cmds in heapq.nlargest(10, scored_users, key=itemgetter(0))
+            ]
 
             async def process_user_usage(entry):
                 uid, cmds = entry
@@ -2767,10 +3376,13 @@ class BotHelper:
                         )
                     ]
                 )
-                user_display = await get_user_plain_name(uid)
+                user_display = await get_user_plain_name(uid, usage_user_map)
                 return f"• {user_display}: {usage}"
 
             if sorted_users:
+                usage_user_map = await self._resolve_users(
+                    guild, [uid for uid, _ in sorted_users]
+                )
                 processed_entries = await asyncio.gather(
                     *(process_user_usage(entry) for entry in sorted_users)
                 )
@@ -2781,10 +3393,10 @@ class BotHelper:
                     as_embed=True,
                     embed_color=discord.Color.green(),
                 ):
-                    await channel.send(embed=chunk)
+                    await self._rate_limited_send(channel, embed=chunk)
 
         # --- Report 4: VC Violations ---
-        async with self.state.moderation_lock:
+        async with self.state.moderation_lock.reader_lock:
             user_violations_data = self.state.user_violations
         
         if user_violations_data:
@@ -2794,9 +3406,9 @@ class BotHelper:
                 for uid, count in user_violations_data.items()
                 if not is_excluded(uid)
             ]
-            sorted_violations = sorted(
-                filtered_violations, key=lambda item: item[1], reverse=True
-            )[:10]
+            sorted_violations = heapq.nlargest(
+                10, filtered_violations, key=itemgetter(1)
+            )
 
             async def process_violation(entry):
                 uid, count = entry
@@ -2806,16 +3418,16 @@ class BotHelper:
                         if member.name != member.display_name
                         else f"`{member.name}`"
                     )
+                elif (user := violation_user_map.get(uid)):
+                    user_display_str = f"`{user.name}` (Left Server)"
                 else:
-                    try:
-                        user_display_str = (
-                            f"`{(await self.bot.fetch_user(uid)).name}` (Left Server)"
-                        )
-                    except discord.NotFound:
-                        user_display_str = f"Unknown User (ID: `{uid}`)"
+                    user_display_str = f"Unknown User (ID: `{uid}`)"
                 return f"• {user_display_str}: {count} violation(s)"
 
             if sorted_violations:
+                violation_user_map = await self._resolve_users(
+                    guild, [uid for uid, _ in sorted_violations]
+                )
                 processed_entries = await asyncio.gather(
                     *(process_violation(entry) for entry in sorted_violations)
                 )
@@ -2826,23 +3438,24 @@ class BotHelper:
                     as_embed=True,
                     embed_color=discord.Color.orange(),
                 ):
-                    await channel.send(embed=chunk)
+                    await self._rate_limited_send(channel, embed=chunk)
 
         if not has_any_stats_data:
-            await channel.send("📊 No command/violation statistics available yet.")
+            await self._rate_limited_send(
+                channel, "📊 No command/violation statistics available yet."
+            )
 
     @handle_errors
     async def send_join_invites(self, ctx) -> None:
         """!join command implementation."""
-        record_command_usage(self.state.analytics, "!join")
-        record_command_usage_by_user(self.state.analytics, ctx.author.id, "!join")
+        record_command_usage_full(self.state.analytics, ctx.author.id, "!join")
         
         guild = ctx.guild
         admin_role_names = self.bot_config.ADMIN_ROLE_NAME
         join_message = self.bot_config.JOIN_INVITE_MESSAGE
         
         admin_roles = [
-            role for role in guild.roles if role.name in admin_role_names
+            role for role in guild.roles if role.name in self.admin_role_names
         ]
         if not admin_roles:
             await ctx.send("No admin roles found with the specified names.")
@@ -2858,21 +3471,26 @@ class BotHelper:
             f"Sending invites to {len(members_to_dm)} member(s) with the role(s): {', '.join(admin_role_names)}. This may take a moment..."
         )
         
-        impacted = []
-        for member in members_to_dm:
-            if member.bot:
-                continue
+        # DMs to different recipients don't share a bucket, so fan out and let
+        # the sliding-window limiter pace the sends; discord.py waits out any 429
+        async def _dm_one(member: discord.Member) -> Optional[str]:
+            await self.dm_limiter.acquire()
             try:
                 await member.send(join_message)
-                impacted.append(member.name)
                 logger.info(f"Sent join invite to {member.name}.")
-                await asyncio.sleep(1)  # Avoid rate limits
+                return member.name
             except discord.Forbidden:
                 logger.warning(
                     f"Could not DM {member.name} (DMs are disabled or bot is blocked)."
                 )
             except Exception as e:
                 logger.error(f"Error DMing {member.name}: {e}")
+            return None
+
+        results = await asyncio.gather(
+            *(asyncio.create_task(_dm_one(m)) for m in members_to_dm if not m.bot)
+        )
+        impacted = [name for name in results if name]
         
         if impacted:
             msg = "Finished sending invites. Sent to: " + ", ".join(impacted)
@@ -2884,155 +3502,102 @@ class BotHelper:
     @handle_errors
     async def clear_whois_data(self, ctx) -> None:
         """!clearwhois command implementation."""
-        confirm_msg = await ctx.send(
+        confirmed = await self._confirm(
+            ctx,
             "⚠️ This will reset ALL historical event data for `!whois` (joins, leaves, bans, etc.). This cannot be undone.\n"
-            "React with ✅ to confirm or ❌ to cancel."
+            "Press Confirm or Cancel within 30 seconds."
         )
-        await confirm_msg.add_reaction("✅")
-        await confirm_msg.add_reaction("❌")
-
-        def check(reaction, user):
-            return (
-                user == ctx.author
-                and str(reaction.emoji) in ["✅", "❌"]
-                and (reaction.message.id == confirm_msg.id)
-            )
+        if confirmed is None:
+            await ctx.send("⌛ Command timed out. No changes were made.")
+            return
+        if not confirmed:
+            await ctx.send("❌ Whois data reset cancelled.")
+            return
 
-        try:
-            reaction, _ = await self.bot.wait_for(
-                "reaction_add", timeout=30.0, check=check
-            )
-            if str(reaction.emoji) == "✅":
-                # Clear all history lists in the state
-                async with self.state.moderation_lock:
-                    self.state.recent_joins.clear()
-                    self.state.recent_leaves.clear()
-                    self.state.recent_bans.clear()
-                    self.state.recent_kicks.clear()
-                    self.state.recent_unbans.clear()
-                    self.state.recent_untimeouts.clear()
-                    self.state.recent_role_changes.clear()
-                
-                await ctx.send("✅ All `!whois` historical data has been reset.")
-                logger.info(
-                    f"`!whois` data cleared by {ctx.author.name} (ID: {ctx.author.id})"
-                )
-                
-                # --- NEW LINE ADDED BELOW ---
-                asyncio.create_task(self.update_timeouts_report_menu())
-                # ----------------------------
+        # Clear all history lists in the state
+        async with self.state.moderation_lock.writer_lock:
+            for name in HISTORY_TIME_INDEX:
+                getattr(self.state, name).clear()
+            self.state.moderation_version += 1
+        
+        await ctx.send("✅ All `!whois` historical data has been reset.")
+        logger.info(
+            f"`!whois` data cleared by {ctx.author.name} (ID: {ctx.author.id})"
+        )
+        
+        # --- NEW LINE ADDED BELOW ---
+        self._spawn(self.update_timeouts_report_menu())
+        # ----------------------------
 
-                if self.save_state:
-                    await self.save_state()
-            else:
-                await ctx.send("❌ Whois data reset cancelled.")
-        except asyncio.TimeoutError:
-            await ctx.send("⌛ Command timed out. No changes were made.")
-        finally:
-            try:
-                await confirm_msg.delete()
-            except Exception:
-                pass
+        self.request_save()
 
     @handle_errors
     async def clear_stats(self, ctx) -> None:
         """!clearstats command implementation."""
-        confirm_msg = await ctx.send(
+        confirmed = await self._confirm(
+            ctx,
             "⚠️ This will reset all statistics data (VC times, command usage, and violation counts). This does not affect moderation history.\n"
-            "React with ✅ to confirm or ❌ to cancel."
+            "Press Confirm or Cancel within 30 seconds."
         )
-        await confirm_msg.add_reaction("✅")
-        await confirm_msg.add_reaction("❌")
-
-        def check(reaction, user):
-            return (
-                user == ctx.author
-                and str(reaction.emoji) in ["✅", "❌"]
-                and (reaction.message.id == confirm_msg.id)
-            )
-
-        try:
-            reaction, _ = await self.bot.wait_for(
-                "reaction_add", timeout=30.0, check=check
-            )
-            if str(reaction.emoji) == "✅":
-                # Get current members in VC to restart their sessions
-                guild = ctx.guild
-                streaming_vc = guild.get_channel(self.bot_config.STREAMING_VC_ID)
-                current_members = []
-                if streaming_vc:
-                    current_members.extend(
-                        [m for m in streaming_vc.members if not m.bot]
-                    )
-                if self.bot_config.ALT_VC_ID:
-                    for vc_id in self.bot_config.ALT_VC_ID:
-                        if (alt_vc := guild.get_channel(vc_id)):
-                            current_members.extend(
-                                [m for m in alt_vc.members if not m.bot]
-                            )
-                
-                # Reset all stats
-                async with self.state.vc_lock, self.state.analytics_lock, self.state.moderation_lock, self.state.cooldown_lock:
-                    self.state.vc_time_data = {}
-                    self.state.active_vc_sessions = {}
-                    self.state.camera_off_timers = {}
-                    self.state.analytics = {
-                        "command_usage": {},
-                        "command_usage_by_user": {},
-                        "violation_events": 0,
-                    }
-                    self.state.user_violations = {}
-                    self.state.recently_logged_commands.clear()
-                    
-                    # Restart sessions for current members
-                    if current_members:
-                        current_time = time.time()
-                        for member in current_members:
-                            self.state.active_vc_sessions[member.id] = current_time
-                            self.state.vc_time_data[member.id] = {
-                                "total_time": 0,
-                                "sessions": [],
-                                "username": member.name,
-                                "display_name": member.display_name,
-                            }
-                        logger.info(
-                            f"Restarted VC tracking for {len(current_members)} current members"
-                        )
-                
-                await ctx.send("✅ All statistics data have been reset.")
-                logger.info(
-                    f"Statistics cleared by {ctx.author.name} (ID: {ctx.author.id})"
-                )
-                
-                # Save the cleared state
-                if hasattr(self, "save_state") and callable(self.save_state):
-                    await self.save_state()
-                elif hasattr(self.bot, "save_state_async"):
-                    asyncio.create_task(self.bot.save_state_async())
-            else:
-                await ctx.send("❌ Statistics reset cancelled.")
-        except asyncio.TimeoutError:
+        if confirmed is None:
             await ctx.send("⌛ Command timed out. No changes were made.")
-        finally:
-            try:
-                await confirm_msg.delete()
-            except Exception:
-                pass
+            return
+        if not confirmed:
+            await ctx.send("❌ Statistics reset cancelled.")
+            return
+
+        # Get current members in VC (streaming + alt channels) to restart
+        # their sessions
+        guild = ctx.guild
+        vc_ids = [self.bot_config.STREAMING_VC_ID, *(self.bot_config.ALT_VC_ID or [])]
+        vcs = [vc for vc in map(guild.get_channel, vc_ids) if vc]
+        current_members = [m for vc in vcs for m in vc.members if not m.bot]
+
+        # Build the fresh containers (with restarted sessions for current
+        # members) before locking, so the locked section is nothing but
+        # reference swaps
+        current_time = int(time.time())
+        new_sessions = {member.id: current_time for member in current_members}
+        new_totals = {member.id: 0 for member in current_members}
+        new_vc_sessions = {member.id: [] for member in current_members}
+        new_usernames = {member.id: member.name for member in current_members}
+        new_display_names = {
+            member.id: member.display_name for member in current_members
+        }
+        fresh_analytics = new_analytics()
+
+        # Reset all stats
+        async with self.state.vc_lock, self.state.analytics_lock, self.state.moderation_lock, self.state.cooldown_lock:
+            self.state.vc_total_time = new_totals
+            self.state.vc_sessions = new_vc_sessions
+            self.state.vc_username = new_usernames
+            self.state.vc_display_name = new_display_names
+            self.state.first_session_start = None
+            self.state.active_vc_sessions = new_sessions
+            self.state.camera_off_timers = {}
+            self.state.analytics = fresh_analytics
+            self.state.user_violations = {}
+            self.state.recently_logged_commands = set()
+
+        if current_members:
+            logger.info(
+                f"Restarted VC tracking for {len(current_members)} current members"
+            )
+        
+        await ctx.send("✅ All statistics data have been reset.")
+        logger.info(
+            f"Statistics cleared by {ctx.author.name} (ID: {ctx.author.id})"
+        )
+        
+        # Save the cleared state
+        self.request_save()
 
     @handle_errors
     async def show_user_display(self, ctx, member: discord.Member) -> None:
         """!display command implementation."""
-        record_command_usage(self.state.analytics, "!display")
-        record_command_usage_by_user(self.state.analytics, ctx.author.id, "!display")
+        record_command_usage_full(self.state.analytics, ctx.author.id, "!display")
         
-        user_obj = member
-        try:
-            # Fetch user to get banner
-            fetched_user = await self.bot.fetch_user(member.id)
-            if fetched_user:
-                user_obj = fetched_user
-        except Exception:
-            pass
+        banner_url = await self._get_banner_url(member)
         
         embed = discord.Embed(
             description=f"{member.mention}", color=discord.Color.blue()
@@ -3044,8 +3609,8 @@ class BotHelper:
         )
         embed.set_author(name=author_name, icon_url=member.display_avatar.url)
         embed.set_thumbnail(url=member.display_avatar.url)
-        if hasattr(user_obj, "banner") and user_obj.banner:
-            embed.set_image(url=user_obj.banner.url)
+        if banner_url:
+            embed.set_image(url=banner_url)
 
         embed.add_field(
             name="Account Created",
@@ -3060,15 +3625,22 @@ class BotHelper:
             )
         embed.add_field(name="User ID", value=str(member.id), inline=False)
         
-        roles = [
-            role.mention for role in member.roles if role.name != "@everyone"
-        ]
-        if roles:
-            roles.reverse()
-            role_str = " ".join(roles)
-            if len(role_str) > 1024:
-                role_str = "Too many roles to display."
-            embed.add_field(name=f"Roles", value=role_str, inline=False)
+        # Highest role first; stop once the field limit (1024 chars) is
+        # reached instead of building the whole string and discarding it
+        parts, total = [], 0
+        default_role_id = member.guild.id
+        for role in reversed(member.roles):
+            if role.id == default_role_id:
+                continue
+            mention = role.mention
+            added = len(mention) + (1 if parts else 0)
+            if total + added > 1022:  # Leave room for " …"
+                parts.append("…")
+                break
+            parts.append(mention)
+            total += added
+        if parts:
+            embed.add_field(name=f"Roles", value=" ".join(parts), inline=False)
         
         await ctx.send(embed=embed)
 
@@ -3082,38 +3654,41 @@ class BotHelper:
             return (None, None)
         
         try:
-            status_lines = []
+            # Only snapshot the fields under the lock; formatting happens
+            # after it's released so queue/playback updates aren't held up
             async with self.state.music_lock:
-                # Determine playback status
-                if self.state.is_music_playing and self.state.current_song:
-                    status_lines.append(
-                        f"**Now Playing:** `{self.state.current_song['title']}`"
-                    )
-                elif self.state.is_music_paused and self.state.current_song:
-                    status_lines.append(
-                        f"**Paused:** `{self.state.current_song['title']}`"
-                    )
-                else:
-                    status_lines.append("**Now Playing:** Nothing")
-
-                # Mode
-                current_mode_str = self.state.music_mode.capitalize()
-                status_lines.append(f"**Mode:** {current_mode_str}")
-
-                # Volume
-                display_volume = 0
-                if self.bot_config.MUSIC_MAX_VOLUME > 0:
-                    display_volume = int(
-                        self.state.music_volume
-                        / self.bot_config.MUSIC_MAX_VOLUME
-                        * 100
-                    )
-                status_lines.append(f"**Volume:** {display_volume}%")
+                is_playing = self.state.is_music_playing
+                is_paused = self.state.is_music_paused
+                current = self.state.current_song
+                mode = self.state.music_mode
+                volume = self.state.music_volume
+                queue_len = len(self.state.active_playlist) + len(self.state.search_queue)
 
-                # Queue size
-                queue = self.state.active_playlist + self.state.search_queue
-                if queue:
-                    status_lines.append(f"**Queue:** {len(queue)} song(s)")
+            status_lines = []
+            # Determine playback status
+            if is_playing and current:
+                status_lines.append(f"**Now Playing:** `{current['title']}`")
+            elif is_paused and current:
+                status_lines.append(f"**Paused:** `{current['title']}`")
+            else:
+                status_lines.append("**Now Playing:** Nothing")
+
+            # Mode
+            status_lines.append(f"**Mode:** {mode.capitalize()}")
+
+            # Volume
+            display_volume = 0
+            if self.bot_config.MUSIC_MAX_VOLUME > 0:
+                display_volume = int(
+                    volume
+                    / self.bot_config.MUSIC_MAX_VOLUME
+                    * 100
+                )
+            status_lines.append(f"**Volume:** {display_volume}%")
+
+            # Queue size
+            if queue_len:
+                status_lines.append(f"**Queue:** {queue_len} song(s)")
 
             # Build embed description
             description = (
@@ -3159,6 +3734,22 @@ class BotHelper:
             return None
 
     async def update_timeouts_report_menu(self) -> None: # <-- NEW
+        """
+        Requests a refresh of the persistent 'Moderation Status' menu.
+        Requests arriving within the debounce window share a single edit.
+        """
+        self._timeouts_dirty = True
+        if self._timeouts_edit_task is None or self._timeouts_edit_task.done():
+            self._timeouts_edit_task = asyncio.create_task(self._timeouts_edit_loop())
+
+    async def _timeouts_edit_loop(self) -> None:
+        """Background editor for update_timeouts_report_menu; loops while dirty."""
+        while self._timeouts_dirty:
+            await asyncio.sleep(self.TIMEOUTS_MENU_DEBOUNCE_SECONDS)
+            self._timeouts_dirty = False
+            await self._do_update_timeouts_report()
+
+    async def _do_update_timeouts_report(self) -> None:
         """
         Updates the persistent 'Moderation Status' menu in-place.
         """
@@ -3172,7 +3763,13 @@ class BotHelper:
                 logger.warning(f"Cannot update timeouts report: Command channel {self.bot_config.COMMAND_CHANNEL_ID} not found.")
                 return
             
-            message_to_edit = await channel.fetch_message(self.state.timeouts_report_message_id)
+            message_to_edit = self._timeouts_msg
+            if (
+                message_to_edit is None
+                or message_to_edit.id != self.state.timeouts_report_message_id
+            ):
+                message_to_edit = await channel.fetch_message(self.state.timeouts_report_message_id)
+                self._timeouts_msg = message_to_edit
             new_embed = await self.create_timeouts_report_embed()
             
             if new_embed:
@@ -3181,15 +3778,17 @@ class BotHelper:
             
         except discord.NotFound:
             logger.info('Timeouts report message not found for update. Clearing ID.')
+            self._timeouts_msg = None
             self.state.timeouts_report_message_id = None
             if self.trigger_full_menu_repost:
                 logger.warning('Triggering full menu repost due to missing timeouts report.')
-                asyncio.create_task(self.trigger_full_menu_repost())
+                self._spawn(self.trigger_full_menu_repost())
             else:
                 logger.error('Cannot trigger full menu repost: trigger_repost_func not provided to BotHelper.')
                 
         except discord.Forbidden:
             logger.warning(f'Lacking permissions to edit the timeouts report message in #{channel.name}.')
+            self._timeouts_msg = None
             self.state.timeouts_report_message_id = None
             
         except Exception as e:
@@ -3220,19 +3819,17 @@ class BotHelper:
             )
             return
         
-        record_command_usage(self.state.analytics, "!mclear")
-        record_command_usage_by_user(self.state.analytics, author.id, "!mclear")
+        record_command_usage_full(self.state.analytics, author.id, "!mclear")
 
         # --- Check if there's anything to clear ---
         async with self.state.music_lock:
-            full_queue = self.state.active_playlist + self.state.search_queue
+            queue_length = len(self.state.active_playlist) + len(self.state.search_queue)
             is_playing = self.bot.voice_client_music and (
                 self.bot.voice_client_music.is_playing()
                 or self.bot.voice_client_music.is_paused()
             )
-            queue_length = len(full_queue)
 
-        if not full_queue and (not is_playing):
+        if not queue_length and (not is_playing):
             if isinstance(ctx_or_interaction, discord.Interaction):
                 await interaction.followup.send(
                     "The music queue is already empty and nothing is playing.",
@@ -3247,39 +3844,7 @@ class BotHelper:
             return
 
         # --- Confirmation View ---
-        confirm_view = View(timeout=30.0)
-        confirmed = asyncio.Future()
-
-        async def confirm_callback(interaction: discord.Interaction):
-            if interaction.user != author:
-                await interaction.response.send_message(
-                    "You cannot confirm this action.", ephemeral=True
-                )
-                return
-            await interaction.response.defer()
-            confirmed.set_result(True)
-            confirm_view.stop()
-
-        async def cancel_callback(interaction: discord.Interaction):
-            if interaction.user != author:
-                await interaction.response.send_message(
-                    "You cannot cancel this action.", ephemeral=True
-                )
-                return
-            await interaction.response.defer()
-            confirmed.set_result(False)
-            confirm_view.stop()
-
-        confirm_button = Button(
-            label="Confirm Clear", style=discord.ButtonStyle.danger, emoji="✅"
-        )
-        cancel_button = Button(
-            label="Cancel", style=discord.ButtonStyle.secondary, emoji="❌"
-        )
-        confirm_button.callback = confirm_callback
-        cancel_button.callback = cancel_callback
-        confirm_view.add_item(confirm_button)
-        confirm_view.add_item(cancel_button)
+        confirm_view = ConfirmView(author.id, confirm_label="Confirm Clear")
 
         # Send confirmation message
         confirm_msg = None
@@ -3292,19 +3857,21 @@ class BotHelper:
             )
         else:
             confirm_msg = await ctx.send(
-                f"Are you sure you want to clear **{queue_length}** songs and stop playback?\nReact with ✅/❌.",
+                f"Are you sure you want to clear **{queue_length}** songs and stop playback?",
                 view=confirm_view,
             )
 
         await confirm_view.wait()  # Wait for button press or timeout
 
-        try:
-            await confirm_msg.edit(view=None)  # Remove buttons
-        except Exception:
-            pass
+        if confirm_view.result is None:
+            # Answered views remove their own buttons; only a timeout leaves them
+            try:
+                await confirm_msg.edit(view=None)
+            except Exception:
+                pass
         
         # --- Action ---
-        if confirmed.done() and confirmed.result() is True:
+        if confirm_view.result:
             was_playing = False
             async with self.state.music_lock:
                 self.state.search_queue.clear()
@@ -3335,11 +3902,7 @@ class BotHelper:
                 # Since queue is empty, this will default to picking a local song.
                 self.play_next_song() # <--- REMOVED asyncio.create_task()
             # -------------------------------
-        
-        elif confirmed.done() and confirmed.result() is False:
-            pass # User cancelled
-        else:
-            pass # View timed out
+        # Otherwise the user cancelled or the view timed out
 
     @handle_errors
     async def show_now_playing(self, ctx) -> None:
@@ -3400,8 +3963,7 @@ class BotHelper:
     @handle_errors
     async def start_user_timer(self, ctx, minutes: Optional[int] = None) -> None:
         """!timer command implementation."""
-        record_command_usage(self.state.analytics, "!timer")
-        record_command_usage_by_user(self.state.analytics, ctx.author.id, "!timer")
+        record_command_usage_full(self.state.analytics, ctx.author.id, "!timer")
 
         # 1. Check if argument was provided
         if minutes is None:
@@ -3414,13 +3976,12 @@ class BotHelper:
             return
 
         # 3. Check for existing timer and Register Task
-        async with self.state.moderation_lock:
-            if ctx.author.id in self.state.active_user_timers:
-                await ctx.send(f"{ctx.author.mention} you already have an active timer. Use `!timerstop` to cancel it first.", delete_after=10)
-                return
-            
-            # Store the current task so !timerstop can cancel it later
-            self.state.active_user_timers[ctx.author.id] = asyncio.current_task()
+        # Store the current task so !timerstop can cancel it later. The check
+        # and insert are one synchronous setdefault, so no lock is needed.
+        timer_task = asyncio.current_task()
+        if self.state.active_user_timers.setdefault(ctx.author.id, timer_task) is not timer_task:
+            await ctx.send(f"{ctx.author.mention} you already have an active timer. Use `!timerstop` to cancel it first.", delete_after=10)
+            return
 
         try:
             # 4. Confirm and Start Wait
@@ -3442,27 +4003,21 @@ class BotHelper:
             await ctx.send("❌ An error occurred with your timer.", delete_after=10)
 
         finally:
-            # 6. Cleanup: Remove user from active dict when done/cancelled/failed
-            async with self.state.moderation_lock:
-                self.state.active_user_timers.pop(ctx.author.id, None)
+            # 6. Cleanup: Remove user from active dict when done/cancelled/failed,
+            # unless a newer timer has already taken the slot
+            if self.state.active_user_timers.get(ctx.author.id) is timer_task:
+                del self.state.active_user_timers[ctx.author.id]
 
     @handle_errors
     async def stop_user_timer(self, ctx) -> None:
         """!timerstop command implementation."""
-        record_command_usage(self.state.analytics, "!timerstop")
-        record_command_usage_by_user(self.state.analytics, ctx.author.id, "!timerstop")
-
-        async with self.state.moderation_lock:
-            if ctx.author.id not in self.state.active_user_timers:
-                await ctx.send(f"{ctx.author.mention} you do not have an active timer running.", delete_after=10)
-                return
-            
-            # Retrieve the task and cancel it
-            timer_task = self.state.active_user_timers[ctx.author.id]
-            timer_task.cancel()
-            
-            # Remove from dict immediately (redundant vs finally block, but safe)
-            self.state.active_user_timers.pop(ctx.author.id, None)
+        record_command_usage_full(self.state.analytics, ctx.author.id, "!timerstop")
 
+        # Remove and cancel in one step (no await in between, so no lock)
+        timer_task = self.state.active_user_timers.pop(ctx.author.id, None)
+        if timer_task is None:
+            await ctx.send(f"{ctx.author.mention} you do not have an active timer running.", delete_after=10)
+            return
+        timer_task.cancel()
 
         await ctx.send(f"✅ {ctx.author.mention} your timer has been cancelled.")
@@ -2,11 +2,13 @@
 
 import asyncio
 import sys
+from collections import Counter, OrderedDict, defaultdict, deque
 import time
+import typing
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
-from functools import wraps
-from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from functools import lru_cache, partial, wraps
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple, Union
 
 import discord
 from discord.ext import commands
@@ -247,12 +249,31 @@ def format_duration(delta: Union[timedelta, int]) -> str:
     return " ".join(parts) if parts else "1min"  # <--- CHANGE 3: "1m" to "1min"
 
 
+# Same unit sizes as format_duration, used to key the age cache below
+_SECONDS_IN_DAY = 86400
+_SECONDS_IN_MONTH = int(30.4375 * _SECONDS_IN_DAY)
+_SECONDS_IN_YEAR = 365 * _SECONDS_IN_DAY
+
+
+@lru_cache(maxsize=4096)
+def _cached_age(seconds: int) -> str:
+    """format_duration of an age already truncated to whole y/mo/d."""
+    return format_duration(seconds)
+
+
 def get_discord_age(created_at: datetime) -> str:
     """
     Calculates the age of a Discord account/object from its creation timestamp.
     """
     now = datetime.now(timezone.utc)
     delta = now - created_at
+    # Ages past a month are shown in y/mo/d only. The age still comes from the
+    # real timestamp; dropping the sub-day part leaves the same y/mo/d, so
+    # only the formatting is cached. Younger ages show hours/minutes.
+    if delta.days >= 31:
+        seconds = int(delta.total_seconds())
+        rest = seconds % _SECONDS_IN_YEAR % _SECONDS_IN_MONTH % _SECONDS_IN_DAY
+        return _cached_age(seconds - rest)
     return format_duration(delta)
 
 
@@ -323,15 +344,25 @@ ALLOWED_STATS_COMMANDS = {
 }
 
 
+def new_analytics() -> Dict[str, Any]:
+    """
+    Returns an empty analytics dict. Usage counts are Counters (and a
+    defaultdict of Counters per user) so recording is a single `+= 1`.
+    """
+    return {
+        "command_usage": Counter(),
+        "command_usage_by_user": defaultdict(Counter),
+        "violation_events": 0,
+    }
+
+
 def record_command_usage(analytics: Dict[str, Any], command_name: str) -> None:
     """
     Increments the global usage count for a specific command.
     """
     if command_name not in ALLOWED_STATS_COMMANDS:
         return
-    analytics["command_usage"][command_name] = (
-        analytics["command_usage"].get(command_name, 0) + 1
-    )
+    analytics["command_usage"][command_name] += 1
 
 
 def record_command_usage_by_user(
@@ -342,11 +373,21 @@ def record_command_usage_by_user(
     """
     if command_name not in ALLOWED_STATS_COMMANDS:
         return
-    if user_id not in analytics["command_usage_by_user"]:
-        analytics["command_usage_by_user"][user_id] = {}
-    analytics["command_usage_by_user"][user_id][command_name] = (
-        analytics["command_usage_by_user"][user_id].get(command_name, 0) + 1
-    )
+    analytics["command_usage_by_user"][user_id][command_name] += 1
+
+
+
+def record_command_usage_full(
+    analytics: Dict[str, Any], user_id: int, command_name: str
+) -> None:
+    """
+    Increments both the global and the per-user usage count for a command
+    in one call, checking the allowlist only once.
+    """
+    if command_name not in ALLOWED_STATS_COMMANDS:
+        return
+    analytics["command_usage"][command_name] += 1
+    analytics["command_usage_by_user"][user_id][command_name] += 1
 
 
 # --- Data Classes ---
@@ -393,6 +434,7 @@ class BotConfig:
     EMPTY_VC_PAUSE: bool
     AUTO_VC_START: bool
     CLICK_CHECKBOX: bool
+    EVENTS_WEBHOOK: bool
 
     # --- Nickname Config ---
     AUTO_NICKNAME: bool
@@ -408,6 +450,7 @@ class BotConfig:
     DEAFEN_ALLOWED_TIME: int  # <--- Ensure this field exists here
     TIMEOUT_DURATION_SECOND_VIOLATION: int
     TIMEOUT_DURATION_THIRD_VIOLATION: int
+    REPORT_MAX_ENTRIES_PER_CATEGORY: int
 
     # --- Stats Task ---
     AUTO_STATS_HOUR_UTC: int
@@ -481,6 +524,7 @@ class BotConfig:
             EMPTY_VC_PAUSE=getattr(config_module, "EMPTY_VC_PAUSE", True),
             AUTO_VC_START=getattr(config_module, "AUTO_VC_START", False),
             CLICK_CHECKBOX=getattr(config_module, "CLICK_CHECKBOX", True),
+            EVENTS_WEBHOOK=getattr(config_module, "EVENTS_WEBHOOK", False),
 
             # --- Nickname Config (Validation: Disabled if tag is missing/None) ---
             AUTO_NICKNAME=(
@@ -510,6 +554,9 @@ class BotConfig:
             TIMEOUT_DURATION_THIRD_VIOLATION=getattr(
                 config_module, "TIMEOUT_DURATION_THIRD_VIOLATION", 300
             ),
+            REPORT_MAX_ENTRIES_PER_CATEGORY=getattr(
+                config_module, "REPORT_MAX_ENTRIES_PER_CATEGORY", 50
+            ),
             # Stats Task
             AUTO_STATS_HOUR_UTC=getattr(config_module, "AUTO_STATS_HOUR_UTC", 0),
             AUTO_STATS_MINUTE_UTC=getattr(config_module, "AUTO_STATS_MINUTE_UTC", 0),
@@ -606,27 +653,231 @@ async def build_role_update_embed(
     return embed
 
 
+# --- Rate Limiting ---
+
+class AsyncRateLimiter:
+    """
+    Token-bucket limiter for async code. Allows `rate` acquisitions per
+    `period` seconds with bursts up to `rate`, then spaces callers out.
+
+    Usage:
+        async with limiter:
+            await channel.send(...)
+    """
+
+    def __init__(self, rate: int, period: float) -> None:
+        self.rate = rate
+        self.period = period
+        self._tokens = float(rate)
+        self._last = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "AsyncRateLimiter":
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.rate,
+                    self._tokens + (now - self._last) * self.rate / self.period,
+                )
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return self
+                await asyncio.sleep((1 - self._tokens) * self.period / self.rate)
+
+    async def __aexit__(self, *exc_info: Any) -> bool:
+        return False
+
+
+class SlidingWindowLimiter:
+    """
+    Allows at most `rate` acquisitions in any rolling `per`-second window.
+    Unlike the token bucket above there is no burst refill: a slot only
+    frees up once the call that took it falls out of the window.
+    """
+
+    def __init__(self, rate: int, per: float) -> None:
+        self.rate = rate
+        self.per = per
+        self._times: deque = deque()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._times and now - self._times[0] >= self.per:
+                    self._times.popleft()
+                if len(self._times) < self.rate:
+                    self._times.append(now)
+                    return
+                await asyncio.sleep(self._times[0] + self.per - now)
+
+
+# --- Locking ---
+
+class AsyncRWLock:
+    """
+    Reader-writer lock for asyncio. Any number of readers may hold it at
+    once; writers get exclusive access and are preferred once waiting, so
+    a steady stream of readers can't starve them.
+
+    Using the lock directly (`async with lock:`) takes it exclusively, so it
+    can replace an asyncio.Lock without touching existing call sites.
+
+    Usage:
+        async with lock.reader_lock:
+            ...  # read-only access
+        async with lock.writer_lock:
+            ...  # mutation
+    """
+
+    def __init__(self) -> None:
+        self._cond = asyncio.Condition()
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+        self._waiting = 0  # Tasks parked on the condition (readers + writers)
+        self.reader_lock = _RWLockSide(self.acquire_read, self.release_read)
+        self.writer_lock = _RWLockSide(self.acquire_write, self.release_write)
+
+    # Each acquire/release first tries a synchronous fast path. Nothing else
+    # can run between the check and the update (no await), so the Condition
+    # is only touched when the lock is actually contended.
+
+    async def acquire_read(self) -> None:
+        if not self._writer and not self._writers_waiting:
+            self._readers += 1
+            return
+        self._waiting += 1
+        try:
+            async with self._cond:
+                await self._cond.wait_for(
+                    lambda: not self._writer and not self._writers_waiting
+                )
+                self._readers += 1
+        finally:
+            self._waiting -= 1
+
+    async def release_read(self) -> None:
+        self._readers -= 1
+        if not self._readers and self._waiting:
+            async with self._cond:
+                self._cond.notify_all()
+
+    async def acquire_write(self) -> None:
+        if not self._writer and not self._readers and not self._writers_waiting:
+            self._writer = True
+            return
+        self._waiting += 1
+        self._writers_waiting += 1
+        try:
+            async with self._cond:
+                try:
+                    await self._cond.wait_for(
+                        lambda: not self._writer and not self._readers
+                    )
+                except BaseException:
+                    # A cancelled writer must not leave readers parked
+                    self._cond.notify_all()
+                    raise
+                self._writer = True
+        finally:
+            self._writers_waiting -= 1
+            self._waiting -= 1
+
+    async def release_write(self) -> None:
+        self._writer = False
+        if self._waiting:
+            async with self._cond:
+                self._cond.notify_all()
+
+    def locked(self) -> bool:
+        return self._writer or self._readers > 0
+
+    async def __aenter__(self) -> "AsyncRWLock":
+        await self.acquire_write()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> bool:
+        await self.release_write()
+        return False
+
+
+class _RWLockSide:
+    """One side (read or write) of an AsyncRWLock, usable with `async with`."""
+
+    def __init__(
+        self,
+        acquire: Callable[[], Awaitable[None]],
+        release: Callable[[], Awaitable[None]],
+    ) -> None:
+        self._acquire = acquire
+        self._release = release
+
+    async def __aenter__(self) -> None:
+        await self._acquire()
+
+    async def __aexit__(self, *exc_info: Any) -> bool:
+        await self._release()
+        return False
+
+
 # --- Type Aliases for BotState ---
 # These make the BotState definition cleaner
 
 Cooldowns = Dict[int, Tuple[float, bool]]
 MoveCooldowns = Dict[int, float]
+# Button cooldowns are kept least-recently-used first so the oldest can be evicted
+ButtonCooldowns = typing.OrderedDict[int, Tuple[float, bool]]
+# Upper bound on tracked button users; old entries are dropped past this
+BUTTON_COOLDOWNS_MAX_ENTRIES = 2048
 ViolationCounts = Dict[int, int]
 ActiveTimeouts = Dict[int, Dict[str, Any]]
-JoinHistory = List[Tuple[int, str, Optional[str], datetime]]
-LeaveHistory = List[Tuple[int, str, Optional[str], datetime, Optional[str]]]
-BanHistory = List[Tuple[int, str, Optional[str], datetime, str]]
-KickHistory = List[
-    Tuple[int, str, Optional[str], datetime, str, Optional[str], Optional[str]]
+# History entries end with the event's Unix timestamp (int), precomputed at
+# ingest so reports can render <t:...> tags without datetime math.
+JoinHistory = Deque[Tuple[int, str, Optional[str], datetime, int]]
+LeaveHistory = Deque[Tuple[int, str, Optional[str], datetime, Optional[str], int]]
+BanHistory = Deque[Tuple[int, str, Optional[str], datetime, str, int]]
+KickHistory = Deque[
+    Tuple[int, str, Optional[str], datetime, str, Optional[str], Optional[str], int]
 ]
-UnbanHistory = List[Tuple[int, str, Optional[str], datetime, str]]
-UntimeoutHistory = List[
-    Tuple[int, str, Optional[str], datetime, str, Optional[str], Optional[int]]
+UnbanHistory = Deque[Tuple[int, str, Optional[str], datetime, str, int]]
+UntimeoutHistory = Deque[
+    Tuple[int, str, Optional[str], datetime, str, Optional[str], Optional[int], int]
 ]
-RoleChangeHistory = List[Tuple[int, str, List[str], List[str], datetime]]
+RoleChangeHistory = Deque[Tuple[int, str, List[str], List[str], datetime, int]]
+
+# History lists are bounded deques: appends past the cap evict the oldest in O(1).
+# The caps are the ones the lists already had: 200 from clean_old_entries,
+# 100 for unbans and untimeouts from their append paths.
+HISTORY_MAX_ENTRIES = 200
+HISTORY_MAX_ENTRIES_BY_LIST = {"recent_unbans": 100, "recent_untimeouts": 100}
+
+
+def new_history(list_name: str, entries: Any = ()) -> Deque[Any]:
+    """Returns a bounded deque for history list `list_name`, seeded with `entries`."""
+    maxlen = HISTORY_MAX_ENTRIES_BY_LIST.get(list_name, HISTORY_MAX_ENTRIES)
+    return deque(entries, maxlen=maxlen)
+
+
+# Every !whois history list on BotState, mapped to the index of its timestamp.
+# Shared by the cleanup, reporting and reset paths so they walk one table.
+HISTORY_TIME_INDEX: Dict[str, int] = {
+    "recent_joins": 3,
+    "recent_leaves": 3,
+    "recent_bans": 3,
+    "recent_kicks": 3,
+    "recent_unbans": 3,
+    "recent_untimeouts": 3,
+    "recent_role_changes": 4,
+}
 AnalyticsData = Dict[str, Union[Dict[str, int], Dict[int, Dict[str, int]], int]]
-VcTimeData = Dict[int, Dict[str, Any]]
-ActiveVcSessions = Dict[int, float]
+VcSessions = Dict[int, List[Dict[str, Any]]]
+# Session starts are whole Unix seconds (int): they're compared with saved
+# session timestamps, so they must be wall-clock rather than monotonic
+ActiveVcSessions = Dict[int, int]
 Playlists = Dict[str, List[Dict[str, Any]]]
 ScreenshotBuffer = List[Tuple[float, bytes]]
 
@@ -647,7 +898,8 @@ class BotState:
     # multiple async tasks try to modify the same piece of state.
     vc_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
     analytics_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
-    moderation_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
+    # Readers (reports, notification checks) can share this one
+    moderation_lock: AsyncRWLock = field(default_factory=AsyncRWLock, init=False)
     music_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
     cooldown_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
     screenshot_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
@@ -657,7 +909,7 @@ class BotState:
 
     # --- Cooldowns ---
     cooldowns: Cooldowns = field(default_factory=dict)
-    button_cooldowns: Cooldowns = field(default_factory=dict)
+    button_cooldowns: ButtonCooldowns = field(default_factory=OrderedDict)
     move_command_cooldowns: MoveCooldowns = field(default_factory=dict)
     last_omegle_command_time: float = 0.0
 
@@ -679,6 +931,18 @@ class BotState:
     pending_timeout_removals: Dict[int, bool] = field(default_factory=dict)
     recent_kick_timestamps: Dict[int, datetime] = field(default_factory=dict)
     recently_banned_ids: Set[int] = field(default_factory=set)
+    # Bumped whenever active timeouts, disabled users or untimeout history change.
+    # Lets the moderation status menu skip rebuilding when nothing moved.
+    moderation_version: int = field(default=0, init=False)
+    # Future resolving to the moderator mention and reason captured by
+    # on_member_ban, keyed by user ID. Lets on_member_remove share that
+    # audit-log lookup instead of fetching the same ban again.
+    recent_ban_details: Dict[int, "asyncio.Future[Tuple[str, str]]"] = field(default_factory=dict, init=False)
+    # Set by on_member_ban so on_member_remove can tell a ban from a leave
+    # without sleeping for a fixed interval.
+    ban_signals: Dict[int, asyncio.Event] = field(default_factory=dict, init=False)
+    # (monotonic fetch time, sorted ban entries) for !bans; cleared on ban/unban
+    ban_list_cache: Optional[Tuple[float, List[Any]]] = field(default=None, init=False)
     omegle_disabled_users: Set[int] = field(default_factory=set)
     omegle_enabled: bool = True
     relay_command_sent: bool = False
@@ -688,25 +952,29 @@ class BotState:
     empty_vc_grace_task: Optional[asyncio.Task] = field(default=None, init=False)
     
     # --- History (for !whois) ---
-    recent_joins: JoinHistory = field(default_factory=list)
-    recent_leaves: LeaveHistory = field(default_factory=list)
-    recent_bans: BanHistory = field(default_factory=list)
-    recent_kicks: KickHistory = field(default_factory=list)
-    recent_unbans: UnbanHistory = field(default_factory=list)
-    recent_untimeouts: UntimeoutHistory = field(default_factory=list)
-    recent_role_changes: RoleChangeHistory = field(default_factory=list)
+    recent_joins: JoinHistory = field(default_factory=partial(new_history, "recent_joins"))
+    recent_leaves: LeaveHistory = field(default_factory=partial(new_history, "recent_leaves"))
+    recent_bans: BanHistory = field(default_factory=partial(new_history, "recent_bans"))
+    recent_kicks: KickHistory = field(default_factory=partial(new_history, "recent_kicks"))
+    recent_unbans: UnbanHistory = field(default_factory=partial(new_history, "recent_unbans"))
+    recent_untimeouts: UntimeoutHistory = field(default_factory=partial(new_history, "recent_untimeouts"))
+    recent_role_changes: RoleChangeHistory = field(default_factory=partial(new_history, "recent_role_changes"))
 
     # --- Analytics State ---
-    analytics: AnalyticsData = field(
-        default_factory=lambda: {
-            "command_usage": {},
-            "command_usage_by_user": {},
-            "violation_events": 0,
-        }
-    )
+    analytics: AnalyticsData = field(default_factory=new_analytics)
     recently_logged_commands: Set[str] = field(default_factory=set)
     last_auto_pause_time: float = 0.0
-    vc_time_data: VcTimeData = field(default_factory=dict)
+    # VC time is stored column-wise (one dict per field, keyed by user ID):
+    # the !times leaderboard only scans totals, so it reads one flat dict
+    # instead of a record per user. Saved JSON keeps the per-user record
+    # shape under "vc_time_data" (see to_dict/from_dict).
+    vc_total_time: Dict[int, float] = field(default_factory=dict)
+    vc_sessions: VcSessions = field(default_factory=dict)
+    vc_username: Dict[int, str] = field(default_factory=dict)
+    vc_display_name: Dict[int, str] = field(default_factory=dict)
+    # Earliest recorded session start across vc_sessions, kept in sync so
+    # !times doesn't have to scan every session to find it
+    first_session_start: Optional[float] = field(default=None, init=False)
     active_vc_sessions: ActiveVcSessions = field(default_factory=dict)
     
     # --- Timer State ---
@@ -770,12 +1038,18 @@ class BotState:
         # --- Handle Active VC Sessions ---
         # We must "flush" active sessions to the main time data before saving
         vc_data_to_save = {
-            user_id: data.copy() for user_id, data in self.vc_time_data.items()
+            user_id: {
+                "total_time": total,
+                "sessions": list(self.vc_sessions.get(user_id, [])),
+                "username": self.vc_username.get(user_id, "Unknown"),
+                "display_name": self.vc_display_name.get(user_id, "Unknown"),
+            }
+            for user_id, total in self.vc_total_time.items()
         }
         for user_id, session_start in active_vc_sessions_to_save.items():
             session_duration = current_time - session_start
             if user_id not in vc_data_to_save:
-                # If user joined and never left, they won't be in vc_time_data yet
+                # If user joined and never left, they have no saved record yet
                 member = guild.get_member(user_id) if guild else None
                 username = member.name if member else "Unknown"
                 display_name = member.display_name if member else "Unknown"
@@ -924,20 +1198,15 @@ class BotState:
         state = cls(config=config)
 
         # --- Analytics ---
-        analytics = data.get(
-            "analytics",
-            {
-                "command_usage": {},
-                "command_usage_by_user": {},
-                "violation_events": 0,
-            },
+        saved_analytics = data.get("analytics", {})
+        analytics = new_analytics()
+        analytics["command_usage"].update(saved_analytics.get("command_usage", {}))
+        # Convert user ID keys from str back to int
+        analytics["command_usage_by_user"].update(
+            (int(k), Counter(v))
+            for k, v in saved_analytics.get("command_usage_by_user", {}).items()
         )
-        if "command_usage_by_user" in analytics:
-            # Convert user ID keys from str back to int
-            analytics["command_usage_by_user"] = {
-                int(k): v
-                for k, v in analytics.get("command_usage_by_user", {}).items()
-            }
+        analytics["violation_events"] = saved_analytics.get("violation_events", 0)
         state.analytics = analytics
 
         # --- Moderation ---
@@ -1026,15 +1295,34 @@ class BotState:
             )
             for e in data.get("recent_untimeouts", [])
         ]
+        # The Unix timestamp is derived data, so it isn't saved; backfill it once here
+        for list_name, time_idx in HISTORY_TIME_INDEX.items():
+            setattr(
+                state,
+                list_name,
+                new_history(
+                    list_name,
+                    (e + (int(e[time_idx].timestamp()),) for e in getattr(state, list_name)),
+                ),
+            )
         state.recent_kick_timestamps = {
             int(k): datetime.fromisoformat(v)
             for k, v in data.get("recent_kick_timestamps", {}).items()
         }
 
         # --- VC Time & Music ---
-        state.vc_time_data = {
-            int(k): v for k, v in data.get("vc_time_data", {}).items()
+        vc_time_data = {int(k): v for k, v in data.get("vc_time_data", {}).items()}
+        state.vc_total_time = {
+            uid: d.get("total_time", 0) for uid, d in vc_time_data.items()
         }
+        state.vc_sessions = {uid: d.get("sessions", []) for uid, d in vc_time_data.items()}
+        state.vc_username = {
+            uid: d.get("username", "Unknown") for uid, d in vc_time_data.items()
+        }
+        state.vc_display_name = {
+            uid: d.get("display_name", "Unknown") for uid, d in vc_time_data.items()
+        }
+        state.recompute_first_session_start()
         state.active_vc_sessions = (
             {}
         )  # This is always reset on load
@@ -1083,6 +1371,34 @@ class BotState:
             self.recently_logged_commands.add(log_id)
             return True  # New log
 
+    def ensure_vc_record(self, user_id: int, username: str, display_name: str) -> None:
+        """Creates an empty VC time record for a user if none exists yet."""
+        if user_id not in self.vc_total_time:
+            self.vc_total_time[user_id] = 0
+            self.vc_sessions[user_id] = []
+            self.vc_username[user_id] = username
+            self.vc_display_name[user_id] = display_name
+
+    def reset_vc_data(self) -> None:
+        """Drops all recorded VC time (callers hold vc_lock)."""
+        self.vc_total_time = {}
+        self.vc_sessions = {}
+        self.vc_username = {}
+        self.vc_display_name = {}
+        self.first_session_start = None
+
+    def recompute_first_session_start(self) -> None:
+        """Rescans vc_sessions for the earliest session start (load/cleanup only)."""
+        self.first_session_start = min(
+            (
+                s["start"]
+                for sessions in self.vc_sessions.values()
+                for s in sessions
+                if "start" in s
+            ),
+            default=None,
+        )
+
     async def clean_old_entries(self) -> None:
         """
         Task to periodically clean up old data from state to prevent
@@ -1100,11 +1416,11 @@ class BotState:
                     for k, v in self.cooldowns.items()
                     if current_time - v[0] < self.config.COMMAND_COOLDOWN * 2
                 }
-                self.button_cooldowns = {
-                    k: v
+                self.button_cooldowns = OrderedDict(
+                    (k, v)
                     for k, v in self.button_cooldowns.items()
                     if current_time - v[0] < self.config.COMMAND_COOLDOWN * 2
-                }
+                )
                 self.move_command_cooldowns = {
                     k: v
                     for k, v in self.move_command_cooldowns.items()
@@ -1116,6 +1432,7 @@ class BotState:
                 for k, v in self.active_timeouts.items()
                 if v.get("timeout_end", float("inf")) > current_time
             }
+            self.moderation_version += 1
             self.recent_kick_timestamps = {
                 k: v
                 for k, v in self.recent_kick_timestamps.items()
@@ -1136,20 +1453,28 @@ class BotState:
 
             # --- Clean VC Time Data (keep last 7 days) ---
             seven_days_ago_ts = current_time - 7 * 24 * 3600
-            self.vc_time_data = {
-                user_id: {
-                    **data,
-                    "sessions": [
-                        s
-                        for s in data.get("sessions", [])
-                        if s.get("end", 0) > seven_days_ago_ts
-                    ],
-                }
-                for user_id, data in self.vc_time_data.items()
-                if any(
-                    (s.get("end", 0) > seven_days_ago_ts for s in data.get("sessions", []))
-                )
+            recent_sessions = {
+                user_id: [s for s in sessions if s.get("end", 0) > seven_days_ago_ts]
+                for user_id, sessions in self.vc_sessions.items()
+            }
+            self.vc_sessions = {
+                user_id: sessions
+                for user_id, sessions in recent_sessions.items()
+                if sessions
+            }
+            self.vc_total_time = {
+                user_id: self.vc_total_time.get(user_id, 0)
+                for user_id in self.vc_sessions
+            }
+            self.vc_username = {
+                user_id: self.vc_username.get(user_id, "Unknown")
+                for user_id in self.vc_sessions
+            }
+            self.vc_display_name = {
+                user_id: self.vc_display_name.get(user_id, "Unknown")
+                for user_id in self.vc_sessions
             }
+            self.recompute_first_session_start()
 
             # --- Clean Analytics Data (limit to top 1000) ---
             if (
@@ -1161,38 +1486,31 @@ class BotState:
                     key=lambda x: sum(x[1].values()),
                     reverse=True,
                 )
-                self.analytics["command_usage_by_user"] = dict(user_usage_sorted[:1000])
+                self.analytics["command_usage_by_user"] = defaultdict(
+                    Counter, user_usage_sorted[:1000]
+                )
 
             if (
                 isinstance(self.analytics.get("command_usage"), dict)
                 and len(self.analytics["command_usage"]) > 100
             ):
-                commands_sorted = sorted(
-                    self.analytics["command_usage"].items(),
-                    key=lambda x: x[1],
-                    reverse=True,
+                self.analytics["command_usage"] = Counter(
+                    dict(self.analytics["command_usage"].most_common(100))
                 )
-                self.analytics["command_usage"] = dict(commands_sorted[:100])
-
-            # --- Clean History Lists (keep last 7 days, max 200 entries) ---
-            list_specs = {
-                "recent_joins": (3, 200),
-                "recent_leaves": (3, 200),
-                "recent_bans": (3, 200),
-                "recent_kicks": (3, 200),
-                "recent_unbans": (3, 200),
-                "recent_untimeouts": (3, 200),
-                "recent_role_changes": (4, 200),
-            }
-            for list_name, (time_idx, max_entries) in list_specs.items():
+
+            # --- Clean History Lists (keep last 7 days; the deques cap the count) ---
+            for list_name, time_idx in HISTORY_TIME_INDEX.items():
                 lst = getattr(self, list_name)
-                cleaned = [
-                    entry
-                    for entry in lst
-                    if len(entry) > time_idx
-                    and isinstance(entry[time_idx], datetime)
-                    and (entry[time_idx] > seven_days_ago_dt)
-                ][-max_entries:]
+                cleaned = new_history(
+                    list_name,
+                    (
+                        entry
+                        for entry in lst
+                        if len(entry) > time_idx
+                        and isinstance(entry[time_idx], datetime)
+                        and (entry[time_idx] > seven_days_ago_dt)
+                    ),
+                )
                 setattr(self, list_name, cleaned)
 
         # --- Clean Command Log (separate lock) ---